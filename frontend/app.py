@@ -1,3 +1,6 @@
+import hashlib
+import orjson
+
 # Streamlit
 import streamlit as st
 from typing import Dict, Any, Optional
@@ -6,15 +9,38 @@ from typing import Dict, Any, Optional
 from interfaces.api_client import APIClientInterface
 from interfaces.result_formatter import ResultFormatterInterface
 
-# implementations
-from services.firebase_client import FirebaseAPIClient
-from services.data_processor import DataProcessor
-from utils.formatters import MedicalResultFormatter
+# implementations (services and components are imported lazily below)
 from utils.styles import AppStyles
-from components.audio_input import AudioInputComponent
-from components.text_input import TextInputComponent
-from components.results_display import ResultsDisplayComponent
-from components.configuration import ConfigurationComponent
+
+@st.cache_resource
+def get_http_session() -> 'requests.Session':
+    """Shared HTTP session, kept across reruns and sessions so its connection pool stays warm"""
+    from services.firebase_client import FirebaseAPIClient
+    return FirebaseAPIClient.create_session()
+
+
+def get_api_client() -> APIClientInterface:
+    """This browser session's API client; endpoints are per session, the pool is shared"""
+    if 'api_client' not in st.session_state:
+        from services.firebase_client import FirebaseAPIClient
+        st.session_state.api_client = FirebaseAPIClient(session=get_http_session())
+    return st.session_state.api_client
+
+
+def get_data_processor() -> 'DataProcessor':
+    """This browser session's data processor, bound to its API client"""
+    if 'data_processor' not in st.session_state:
+        from services.data_processor import DataProcessor
+        st.session_state.data_processor = DataProcessor(get_api_client())
+    return st.session_state.data_processor
+
+
+@st.cache_resource
+def get_formatter() -> ResultFormatterInterface:
+    """Shared result formatter"""
+    from utils.formatters import MedicalResultFormatter
+    return MedicalResultFormatter()
+
 
 class MedicalAIApp:
     """
@@ -22,14 +48,22 @@ class MedicalAIApp:
     Uses dependency injection for all services (DIP)
     """
     
+    # Characters of transcription shown in the intermediate results preview
+    TRANSCRIPTION_PREVIEW_CHARS = 200
+    
     def __init__(self):
         """Initialize app with dependency injection"""
-        # Initialize services 
-        self.api_client: APIClientInterface = FirebaseAPIClient()
-        self.formatter: ResultFormatterInterface = MedicalResultFormatter()
-        self.data_processor = DataProcessor(self.api_client)
+        # Initialize services (kept across reruns)
+        self.api_client: APIClientInterface = get_api_client()
+        self.formatter: ResultFormatterInterface = get_formatter()
+        self.data_processor = get_data_processor()
         
         # Initialize UI components
+        from components.audio_input import AudioInputComponent
+        from components.text_input import TextInputComponent
+        from components.results_display import ResultsDisplayComponent
+        from components.configuration import ConfigurationComponent
+        
         self.audio_component = AudioInputComponent()
         self.text_component = TextInputComponent()
         self.results_component = ResultsDisplayComponent(self.formatter)
@@ -65,13 +99,22 @@ class MedicalAIApp:
         """Handle configuration sidebar (SRP)"""
         config = self.config_component.render()
         
+        # Already validated and applied on a previous rerun
+        if config == st.session_state.get('app_config'):
+            return config
+        
         if self.config_component.validate_input(config):
-            # Update API client endpoints
-            self.api_client.set_endpoint('transcription', config['transcription_url'])
-            self.api_client.set_endpoint('extraction', config['extraction_url'])
-            self.api_client.set_endpoint('diagnosis', config['diagnosis_url'])
+            # Update API client endpoints (only when they changed)
+            endpoints = {
+                'transcription': config['transcription_url'],
+                'extraction': config['extraction_url'],
+                'diagnosis': config['diagnosis_url']
+            }
+            if self.api_client.endpoints != endpoints:
+                for service, url in endpoints.items():
+                    self.api_client.set_endpoint(service, url)
             
-            st.session_state.app_config = config
+            st.session_state.app_config = dict(config)
         
         return config
     
@@ -79,6 +122,23 @@ class MedicalAIApp:
         """Render input section and return user inputs"""
         AppStyles.render_section_header("📤 Input Methods")
         
+        self.render_input_widgets()
+        audio_url, text_input = st.session_state.pending_inputs
+        
+        # Process button (outside the fragment so a click reruns the whole
+        # page and the results section picks up the new results)
+        st.markdown("---")
+        if st.button("🔬 Process Medical Data", type="primary", use_container_width=True):
+            if not audio_url and not text_input:
+                st.error("Please provide either an audio URL or text input!")
+            else:
+                self.process_medical_data(audio_url, text_input)
+        
+        return audio_url, text_input
+    
+    @st.fragment
+    def render_input_widgets(self) -> None:
+        """Render input widgets; edits rerun only this fragment"""
         # Input method selection
         input_method = st.radio(
             "Choose input method:",
@@ -98,15 +158,7 @@ class MedicalAIApp:
             if text_input and not self.text_component.validate_input(text_input):
                 text_input = None
         
-        # Process button
-        st.markdown("---")
-        if st.button("🔬 Process Medical Data", type="primary", use_container_width=True):
-            if not audio_url and not text_input:
-                st.error("Please provide either an audio URL or text input!")
-            else:
-                self.process_medical_data(audio_url, text_input)
-        
-        return audio_url, text_input
+        st.session_state.pending_inputs = (audio_url, text_input)
     
     def process_medical_data(self, audio_url: Optional[str], text_input: Optional[str]) -> None:
         """Process medical data through the AI pipeline"""
@@ -114,6 +166,33 @@ class MedicalAIApp:
             st.error("Please provide either an audio URL or text input!")
             return
         
+        # Reject re-entry while a pipeline is still running (double clicks)
+        if st.session_state.get('pipeline_running'):
+            st.warning("Already processing, please wait for the current run to finish.")
+            return
+        
+        # Identical inputs against the same endpoints were already processed
+        input_hash = self._input_digest(audio_url, text_input, st.session_state.app_config)
+        if input_hash == st.session_state.get('last_input_hash') and st.session_state.processing_results:
+            st.info("These inputs were already processed. Showing the previous results.")
+            return
+        
+        st.session_state.pipeline_running = True
+        try:
+            self._run_pipeline(audio_url, text_input, input_hash)
+        finally:
+            st.session_state.pipeline_running = False
+    
+    @staticmethod
+    def _input_digest(audio_url: Optional[str], text_input: Optional[str], 
+                      app_config: Dict[str, Any]) -> str:
+        """Stable digest of the inputs and endpoints (hash() is salted per process)"""
+        payload = orjson.dumps([audio_url, text_input, app_config], option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+    
+    def _run_pipeline(self, audio_url: Optional[str], text_input: Optional[str], 
+                      input_hash: str) -> None:
+        """Run the data processor and render its outcome"""
         # Create progress callback
         def show_progress(message: str):
             AppStyles.render_processing_step(message)
@@ -128,10 +207,11 @@ class MedicalAIApp:
             
             if result['success']:
                 st.session_state.processing_results = result['results']
+                st.session_state.last_input_hash = input_hash
                 AppStyles.render_success_message("Processing completed successfully!")
                 
                 # Always show intermediate results for better UX
-                self._show_intermediate_results(result['results'])
+                self._show_intermediate_results(result['results'], result.get('skipped'))
             else:
                 error_message = result.get('error', 'Unknown error occurred')
                 AppStyles.render_error_message(f"Processing failed: {error_message}")
@@ -141,19 +221,27 @@ class MedicalAIApp:
                     st.warning("Partial results available:")
                     st.session_state.processing_results = result['partial_results']
     
-    def _show_intermediate_results(self, results: Dict[str, Any]) -> None:
+    def _show_intermediate_results(self, results: Dict[str, Any], 
+                                   skipped: Optional[str] = None) -> None:
         """Show intermediate processing results"""
         if 'transcription' in results:
             with st.expander("📝 Transcription Result", expanded=False):
                 transcription = results['transcription'].get('result', {}).get('transcription', '')
-                st.write(transcription[:200] + "..." if len(transcription) > 200 else transcription)
+                limit = self.TRANSCRIPTION_PREVIEW_CHARS
+                if len(transcription) > limit:
+                    transcription = transcription[:limit] + "..."
+                st.write(transcription)
         
         if 'extraction' in results:
             with st.expander("📋 Medical Extraction Result", expanded=False):
                 extraction_result = results['extraction'].get('result', {})
                 if 'symptoms' in extraction_result:
                     st.write("**Symptoms found:**", extraction_result['symptoms'])
+        
+        if skipped == 'diagnosis':
+            st.info("Diagnosis skipped: no symptoms were found in the extracted medical information.")
     
+    @st.fragment
     def render_results_section(self) -> None:
         """Render results section"""
         if st.session_state.processing_results:
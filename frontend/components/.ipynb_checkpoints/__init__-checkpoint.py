@@ -1,5 +0,0 @@
-from .audio_input import AudioInputComponent
-from .text_input import TextInputComponent
-from .results_display import ResultsDisplayComponent
-
-__all__ = ['AudioInputComponent', 'TextInputComponent', 'ResultsDisplayComponent']
@@ -2,6 +2,8 @@ import streamlit as st
 from typing import Optional, Dict, Any
 from interfaces.ui_component import UIComponentInterface
 
+_URL_PREFIXES = ('http://', 'https://')
+
 class AudioInputComponent(UIComponentInterface):
     """Audio Input Component"""
     
@@ -30,7 +32,7 @@ class AudioInputComponent(UIComponentInterface):
             return False
         
         # Basic URL validation
-        if not value.startswith(('http://', 'https://')):
+        if not value.startswith(_URL_PREFIXES):
             st.error("Please provide a valid URL starting with http:// or https://")
             return False
         
@@ -1,6 +1,11 @@
+import re
 import streamlit as st
 from typing import Dict, Any
 from interfaces.ui_component import UIComponentInterface
+from services.firebase_client import RESPONSE_CACHE_KEY
+
+_URL_RE = re.compile(r'https?://')
+_REQUIRED_URLS = ('transcription_url', 'extraction_url', 'diagnosis_url')
 
 class ConfigurationComponent(UIComponentInterface):
     """Configuration component"""
@@ -17,25 +22,37 @@ class ConfigurationComponent(UIComponentInterface):
         with st.sidebar:
             st.header("⚙️ Configuration")
             
-            # API Endpoints
-            st.subheader("API Endpoints")
-            self.config['transcription_url'] = st.text_input(
-                "Transcription API URL", 
-                value=self.config['transcription_url'],
-                help="Your Firebase transcription function URL"
-            )
+            # API Endpoints (a form batches edits into a single rerun on submit)
+            with st.form("config_form"):
+                st.subheader("API Endpoints")
+                self.config['transcription_url'] = st.text_input(
+                    "Transcription API URL", 
+                    value=self.config['transcription_url'],
+                    help="Your Firebase transcription function URL"
+                )
+                
+                self.config['extraction_url'] = st.text_input(
+                    "Medical Extraction API URL", 
+                    value=self.config['extraction_url'],
+                    help="Your Firebase medical extraction function URL"
+                )
+                
+                self.config['diagnosis_url'] = st.text_input(
+                    "Diagnosis API URL", 
+                    value=self.config['diagnosis_url'],
+                    help="Your Firebase diagnosis function URL"
+                )
+                
+                st.form_submit_button("💾 Save endpoints")
             
-            self.config['extraction_url'] = st.text_input(
-                "Medical Extraction API URL", 
-                value=self.config['extraction_url'],
-                help="Your Firebase medical extraction function URL"
-            )
+            st.divider()
             
-            self.config['diagnosis_url'] = st.text_input(
-                "Diagnosis API URL", 
-                value=self.config['diagnosis_url'],
-                help="Your Firebase diagnosis function URL"
-            )
+            # API response cache
+            if st.button("🗑️ Clear cached results", help="Force the next run to call the APIs again"):
+                # Only this session's responses; other users keep theirs
+                st.session_state.pop(RESPONSE_CACHE_KEY, None)
+                st.session_state.pop('last_input_hash', None)
+                st.success("Cached results cleared")
             
             st.divider()
             
@@ -47,13 +64,22 @@ class ConfigurationComponent(UIComponentInterface):
         return self.config
     
     def validate_input(self, value: Dict[str, Any]) -> bool:
-        """Validate configuration"""
-        required_urls = ['transcription_url', 'extraction_url', 'diagnosis_url']
+        """Validate configuration (memoized on the exact config values)"""
+        config_key = tuple(sorted(value.items()))
+        cached = st.session_state.get('_config_validation')
+        
+        if cached and cached[0] == config_key:
+            invalid_key = cached[1]
+        else:
+            invalid_key = next(
+                (url_key for url_key in _REQUIRED_URLS
+                 if not _URL_RE.match(value.get(url_key) or '')),
+                None
+            )
+            st.session_state['_config_validation'] = (config_key, invalid_key)
         
-        for url_key in required_urls:
-            url = value.get(url_key, '')
-            if not url or not url.startswith(('http://', 'https://')):
-                st.error(f"Invalid {url_key}: Must be a valid URL")
-                return False
+        if invalid_key:
+            st.error(f"Invalid {invalid_key}: Must be a valid URL")
+            return False
         
-        return True
\ No newline at end of file
+        return True
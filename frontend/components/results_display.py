@@ -6,6 +6,13 @@ from interfaces.result_formatter import ResultFormatterInterface
 class ResultsDisplayComponent(UIComponentInterface):
     """Results Display Component"""
     
+    # (results key, tab label, formatter method), in display order
+    _TAB_SPEC = (
+        ('transcription', "🎵 Transcription", 'format_transcription'),
+        ('extraction', "📋 Medical Data", 'format_medical_extraction'),
+        ('diagnosis', "🩺 Diagnosis", 'format_diagnosis'),
+    )
+    
     def __init__(self, formatter: ResultFormatterInterface):
         self.formatter = formatter 
         self.results_data = None
@@ -15,38 +22,20 @@ class ResultsDisplayComponent(UIComponentInterface):
         self.results_data = results
         
         # Create tabs based on available results
-        tab_names = []
-        if 'transcription' in results:
-            tab_names.append("🎵 Transcription")
-        if 'extraction' in results:
-            tab_names.append("📋 Medical Data")
-        if 'diagnosis' in results:
-            tab_names.append("🩺 Diagnosis")
+        active = [
+            (key, label, getattr(self.formatter, method))
+            for key, label, method in self._TAB_SPEC
+            if key in results
+        ]
         
-        if not tab_names:
+        if not active:
             st.warning("No results to display")
             return
         
-        tabs = st.tabs(tab_names)
-        tab_index = 0
-        
-        # Transcription tab
-        if 'transcription' in results:
-            with tabs[tab_index]:
-                self.formatter.format_transcription(results['transcription'])
-            tab_index += 1
-        
-        # Medical extraction tab
-        if 'extraction' in results:
-            with tabs[tab_index]:
-                self.formatter.format_medical_extraction(results['extraction'])
-            tab_index += 1
-        
-        # Diagnosis tab
-        if 'diagnosis' in results:
-            with tabs[tab_index]:
-                self.formatter.format_diagnosis(results['diagnosis'])
-            tab_index += 1
+        tabs = st.tabs([label for _, label, _ in active])
+        for (key, _, format_fn), tab in zip(active, tabs):
+            with tab:
+                format_fn(results[key])
     
     def validate_input(self, value: Dict[str, Any]) -> bool:
         """Validate results data structure"""
@@ -54,8 +43,7 @@ class ResultsDisplayComponent(UIComponentInterface):
             return False
         
         # Check if at least one result type exists
-        valid_keys = ['transcription', 'extraction', 'diagnosis']
-        return any(key in value for key in valid_keys)
+        return any(key in value for key, _, _ in self._TAB_SPEC)
     
     def render_error(self, error_message: str, partial_results: Dict[str, Any] = None):
         """Render error state (LSP)"""
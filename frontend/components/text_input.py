@@ -1,7 +1,15 @@
+import re
 import streamlit as st
 from typing import Optional
 from interfaces.ui_component import UIComponentInterface
 
+# Basic medical context check, compiled once at import
+_MEDICAL_RE = re.compile(
+    r'patient|symptoms|pain|diagnosis|treatment|medical|doctor|nurse|'
+    r'hospital|clinic|presents|complains|reports|examination',
+    re.IGNORECASE
+)
+
 class TextInputComponent(UIComponentInterface):
     """Component para input de texto (SRP)"""
     
@@ -35,14 +43,7 @@ class TextInputComponent(UIComponentInterface):
             return False
         
         # Basic medical context check (optional)
-        medical_keywords = [
-            'patient', 'symptoms', 'pain', 'diagnosis', 'treatment', 
-            'medical', 'doctor', 'nurse', 'hospital', 'clinic',
-            'presents', 'complains', 'reports', 'examination'
-        ]
-        
-        text_lower = value.lower()
-        if not any(keyword in text_lower for keyword in medical_keywords):
+        if not _MEDICAL_RE.search(value):
             st.warning("Text doesn't appear to contain medical content. Continue anyway?")
         
         return True
\ No newline at end of file
@@ -1,6 +0,0 @@
-# services/__init__.py
-from .firebase_client import FirebaseAPIClient
-from .data_processor import DataProcessor
-
-__all__ = ['FirebaseAPIClient', 'DataProcessor']
-
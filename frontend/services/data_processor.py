@@ -1,6 +1,15 @@
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Mapping
 from interfaces.api_client import APIClientInterface
 
+# Shared read-only fallback for missing 'result' payloads
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Mirrors TextInputComponent.validate_input so programmatic callers
+# don't send obviously unusable text to the extraction endpoint
+MIN_TEXT_LENGTH = 10
+TEXT_TOO_SHORT_ERROR = f"Text too short: provide at least {MIN_TEXT_LENGTH} characters of medical text"
+
 class DataProcessor:
     """Servicio para procesar pipeline de datos (SRP)"""
     
@@ -40,11 +49,20 @@ class DataProcessor:
                         'step_failed': 'transcription'
                     }
                 
-                current_text = transcription_result.get('result', {}).get('transcription', '')
+                transcription = transcription_result.get('result') or _EMPTY
+                current_text = transcription.get('transcription', '')
                 results['transcription'] = transcription_result
             
             # Step 2: Medical Information Extraction
             if current_text:
+                if len(current_text.strip()) < MIN_TEXT_LENGTH:
+                    return {
+                        'success': False,
+                        'error': TEXT_TOO_SHORT_ERROR,
+                        'step_failed': 'extraction',
+                        'partial_results': results
+                    }
+                
                 if show_progress_callback:
                     show_progress_callback("Step 2/3: Extracting medical information...")
                 
@@ -59,15 +77,24 @@ class DataProcessor:
                     }
                 
                 results['extraction'] = extraction_result
+                extracted = extraction_result.get('result') or _EMPTY
             
             # Step 3: Diagnosis Generation
             if 'extraction' in results:
+                # Nothing to diagnose without symptoms; skip the slow LLM call
+                if not extracted.get('symptoms'):
+                    return {
+                        'success': True,
+                        'results': results,
+                        'skipped': 'diagnosis'
+                    }
+                
                 if show_progress_callback:
                     show_progress_callback("Step 3/3: Generating diagnosis...")
                 
                 # Format data for diagnosis API (match expected structure)
                 diagnosis_payload = {
-                    "medical_info": results['extraction']['result'],
+                    "medical_info": extracted,
                     "include_differential": True,
                     "max_diagnoses": 3
                 }
@@ -104,6 +131,11 @@ class DataProcessor:
             if step == 'transcription':
                 return self.api_client.transcribe_audio(input_data)
             elif step == 'extraction':
+                if not input_data or len(input_data.strip()) < MIN_TEXT_LENGTH:
+                    return {
+                        'success': False,
+                        'error': TEXT_TOO_SHORT_ERROR
+                    }
                 return self.api_client.extract_medical_info(input_data)
             elif step == 'diagnosis':
                 # If input_data doesn't have the wrapper, add it
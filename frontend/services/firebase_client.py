@@ -1,17 +1,67 @@
+import time
+import orjson
 import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 from interfaces.api_client import APIClientInterface
 
+# st.session_state key holding this browser session's memoized responses
+RESPONSE_CACHE_KEY = '_api_response_cache'
+_RESPONSE_CACHE_TTL = 3600
+
+def _cached_post(session: requests.Session, url: str, payload_json: bytes, timeout: int) -> Dict[str, Any]:
+    """POST a JSON payload, memoized per browser session on (url, payload_json, timeout)
+    
+    Responses carry patient data, so they live in st.session_state rather
+    than a process-wide cache. Failed requests raise, so only successful
+    responses are cached. The raw body is kept and parsed on every hit,
+    so callers never share a mutable result.
+    """
+    cache = st.session_state.setdefault(RESPONSE_CACHE_KEY, {})
+    key = (url, payload_json, timeout)
+    cached = cache.get(key)
+    if cached and time.monotonic() - cached[0] < _RESPONSE_CACHE_TTL:
+        return orjson.loads(cached[1])
+    
+    response = session.post(
+        url,
+        data=payload_json,
+        headers={'Content-Type': 'application/json'},
+        timeout=timeout
+    )
+    response.raise_for_status()
+    result = orjson.loads(response.content)
+    cache[key] = (time.monotonic(), response.content)
+    return result
+
 class FirebaseAPIClient(APIClientInterface):
     """Implementación concreta para Firebase Functions (SRP)"""
     
-    def __init__(self, timeout: int = 120):
+    def __init__(self, timeout: int = 120, session: Optional[requests.Session] = None):
         self.timeout = timeout
         self.endpoints = {
             'transcription': '',
             'extraction': '',
             'diagnosis': ''
         }
+        
+        # Reuse TCP/TLS connections across the pipeline calls
+        self.session = session or self.create_session()
+    
+    @staticmethod
+    def create_session() -> requests.Session:
+        """Pooled session with retries; safe to share between clients"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
     
     def set_endpoint(self, service: str, url: str) -> None:
         """Set endpoint URL for specific service (OCP)"""
@@ -23,14 +73,13 @@ class FirebaseAPIClient(APIClientInterface):
     def transcribe_audio(self, audio_url: str) -> Dict[str, Any]:
         """Transcribe audio using Firebase Function"""
         try:
-            response = requests.post(
+            return _cached_post(
+                self.session,
                 self.endpoints['transcription'],
-                json={"audio_url": audio_url},
-                timeout=self.timeout
+                orjson.dumps({"audio_url": audio_url}),
+                self.timeout
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             return {
                 "success": False,
                 "error": f"Transcription API error: {str(e)}",
@@ -40,14 +89,13 @@ class FirebaseAPIClient(APIClientInterface):
     def extract_medical_info(self, text: str) -> Dict[str, Any]:
         """Extract medical information using Firebase Function"""
         try:
-            response = requests.post(
+            return _cached_post(
+                self.session,
                 self.endpoints['extraction'],
-                json={"text": text},
-                timeout=60
+                orjson.dumps({"text": text}),
+                60
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             return {
                 "success": False,
                 "error": f"Medical extraction API error: {str(e)}",
@@ -57,16 +105,16 @@ class FirebaseAPIClient(APIClientInterface):
     def generate_diagnosis(self, medical_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate diagnosis using Firebase Function"""
         try:
-            response = requests.post(
+            # sort_keys so equal nested dicts produce the same cache key
+            return _cached_post(
+                self.session,
                 self.endpoints['diagnosis'],
-                json=medical_data,
-                timeout=60
+                orjson.dumps(medical_data, option=orjson.OPT_SORT_KEYS),
+                60
             )
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             return {
                 "success": False,
                 "error": f"Diagnosis API error: {str(e)}",
                 "result": None
-            }
+            }
\ No newline at end of file
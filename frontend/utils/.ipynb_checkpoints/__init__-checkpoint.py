@@ -1,4 +0,0 @@
-from .formatters import MedicalResultFormatter
-from .styles import AppStyles
-
-__all__ = ['MedicalResultFormatter', 'AppStyles']
\ No newline at end of file
@@ -1,5 +1,6 @@
 import streamlit as st
-from typing import Dict, Any, List
+from html import escape
+from typing import Dict, Any, List, Tuple
 from interfaces.result_formatter import ResultFormatterInterface
 
 class MedicalResultFormatter(ResultFormatterInterface):
@@ -65,23 +66,17 @@ class MedicalResultFormatter(ResultFormatterInterface):
         """Format metadata section"""
         st.subheader("📊 Processing Metadata")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if 'processing_time_seconds' in data:
-                st.metric("Processing Time", f"{data['processing_time_seconds']:.1f}s")
-        
-        with col2:
-            if 'primary_diagnosis_confidence' in data:
-                st.metric("Primary Confidence", f"{data['primary_diagnosis_confidence']:.1%}")
-        
-        with col3:
-            if 'diagnoses_generated' in data:
-                st.metric("Diagnoses Generated", data['diagnoses_generated'])
-        
-        with col4:
-            if 'treatment_recommendations' in data:
-                st.metric("Treatment Items", data['treatment_recommendations'])
+        items = []
+        if 'processing_time_seconds' in data:
+            items.append(("Processing Time", f"{data['processing_time_seconds']:.1f}s"))
+        if 'primary_diagnosis_confidence' in data:
+            items.append(("Primary Confidence", f"{data['primary_diagnosis_confidence']:.1%}"))
+        if 'diagnoses_generated' in data:
+            items.append(("Diagnoses Generated", data['diagnoses_generated']))
+        if 'treatment_recommendations' in data:
+            items.append(("Treatment Items", data['treatment_recommendations']))
+        
+        self._render_metric_grid(items, columns=4)
     
     def _render_patient_info(self, patient_info: Dict[str, Any]) -> None:
         """Render patient information section"""
@@ -90,13 +85,11 @@ class MedicalResultFormatter(ResultFormatterInterface):
         
         st.subheader("👤 Patient Information")
         
-        info_col1, info_col2, info_col3 = st.columns(3)
-        with info_col1:
-            st.write(f"**Name:** {patient_info.get('name', 'N/A')}")
-        with info_col2:
-            st.write(f"**Age:** {patient_info.get('age', 'N/A')}")
-        with info_col3:
-            st.write(f"**ID:** {patient_info.get('identification_number', 'N/A')}")
+        self._render_metric_grid([
+            ("Name", patient_info.get('name', 'N/A')),
+            ("Age", patient_info.get('age', 'N/A')),
+            ("ID", patient_info.get('identification_number', 'N/A'))
+        ], columns=3)
     
     def _render_symptoms(self, symptoms: List[str]) -> None:
         """Render symptoms section"""
@@ -122,14 +115,15 @@ class MedicalResultFormatter(ResultFormatterInterface):
         """Render primary diagnosis with confidence styling"""
         confidence = primary.get('confidence_score', 0)
         confidence_class = self._get_confidence_class(confidence)
+        icd = primary.get('icd_10_code', {})
         
         st.markdown(f"""
         <div class="{confidence_class}">
             <h3>🎯 Primary Diagnosis</h3>
-            <h4>{primary.get('diagnosis_name', 'Unknown')}</h4>
+            <h4>{escape(str(primary.get('diagnosis_name', 'Unknown')))}</h4>
             <p><strong>Confidence:</strong> {confidence:.1%}</p>
-            <p><strong>ICD-10:</strong> {primary.get('icd_10_code', {}).get('code', 'N/A')} - {primary.get('icd_10_code', {}).get('description', 'N/A')}</p>
-            <p><strong>Reasoning:</strong> {primary.get('reasoning', 'No reasoning provided')}</p>
+            <p><strong>ICD-10:</strong> {escape(str(icd.get('code', 'N/A')))} - {escape(str(icd.get('description', 'N/A')))}</p>
+            <p><strong>Reasoning:</strong> {escape(str(primary.get('reasoning', 'No reasoning provided')))}</p>
         </div>
         """, unsafe_allow_html=True)
     
@@ -137,59 +131,93 @@ class MedicalResultFormatter(ResultFormatterInterface):
         """Render differential diagnoses"""
         st.subheader("🔍 Differential Diagnoses")
         
+        # One markdown call for the whole list instead of one per diagnosis
+        parts = []
         for i, diff_diag in enumerate(diff_diagnoses, 1):
             confidence = diff_diag.get('confidence_score', 0)
             confidence_class = self._get_confidence_class(confidence, is_differential=True)
             
-            st.markdown(f"""
+            parts.append(f"""
             <div class="{confidence_class}">
-                <h5>{i}. {diff_diag.get('diagnosis_name', 'Unknown')}</h5>
+                <h5>{i}. {escape(str(diff_diag.get('diagnosis_name', 'Unknown')))}</h5>
                 <p><strong>Confidence:</strong> {confidence:.1%}</p>
-                <p><strong>ICD-10:</strong> {diff_diag.get('icd_10_code', {}).get('code', 'N/A')}</p>
-                <p>{diff_diag.get('reasoning', 'No reasoning provided')}</p>
+                <p><strong>ICD-10:</strong> {escape(str(diff_diag.get('icd_10_code', {}).get('code', 'N/A')))}</p>
+                <p>{escape(str(diff_diag.get('reasoning', 'No reasoning provided')))}</p>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        
+        st.markdown("\n".join(parts), unsafe_allow_html=True)
     
     def _render_treatment_plan(self, treatment_plan: List[Dict[str, Any]]) -> None:
         """Render treatment plan grouped by priority"""
         st.subheader("💊 Treatment Plan")
         
-        # Group by priority
-        high_priority = [t for t in treatment_plan if t.get('priority') == 'high']
-        medium_priority = [t for t in treatment_plan if t.get('priority') == 'medium']
-        low_priority = [t for t in treatment_plan if t.get('priority') == 'low']
+        # Group by priority in a single pass
+        buckets = {'high': [], 'medium': [], 'low': []}
+        for treatment in treatment_plan:
+            priority = treatment.get('priority')
+            if priority in buckets:
+                buckets[priority].append(treatment)
         
-        self._render_priority_treatments("🔴 High Priority", high_priority, "🚨")
-        self._render_priority_treatments("🟡 Medium Priority", medium_priority, "⚠️")
-        self._render_priority_treatments("🟢 Low Priority", low_priority, "ℹ️")
+        self._render_priority_treatments("🔴 High Priority", buckets['high'], "🚨", 'high')
+        self._render_priority_treatments("🟡 Medium Priority", buckets['medium'], "⚠️", 'medium')
+        self._render_priority_treatments("🟢 Low Priority", buckets['low'], "ℹ️", 'low')
     
-    def _render_priority_treatments(self, title: str, treatments: List[Dict[str, Any]], icon: str) -> None:
+    def _render_priority_treatments(self, title: str, treatments: List[Dict[str, Any]], 
+                                    icon: str, priority: str) -> None:
         """Render treatments for a specific priority level"""
         if not treatments:
             return
         
-        st.markdown(f"**{title}:**")
+        # Native <details> blocks in a single markdown call instead of one
+        # st.expander widget per treatment
+        parts = [f"**{title}:**", ""]
         for treatment in treatments:
             recommendation = treatment.get('recommendation', 'No recommendation')
-            with st.expander(f"{icon} {recommendation[:60]}..."):
-                st.write(f"**Full Recommendation:** {recommendation}")
-                st.write(f"**Duration:** {treatment.get('duration', 'N/A')}")
-                st.write(f"**Category:** {treatment.get('category', 'N/A')}")
-                if treatment.get('notes'):
-                    st.write(f"**Notes:** {treatment['notes']}")
+            notes = treatment.get('notes')
+            parts.append(
+                f"<details class=\"priority-{priority}\"><summary>{icon} {escape(recommendation[:60])}...</summary>"
+                f"<p><strong>Full Recommendation:</strong> {escape(recommendation)}</p>"
+                f"<p><strong>Duration:</strong> {escape(str(treatment.get('duration', 'N/A')))}</p>"
+                f"<p><strong>Category:</strong> {escape(str(treatment.get('category', 'N/A')))}</p>"
+                + (f"<p><strong>Notes:</strong> {escape(str(notes))}</p>" if notes else "")
+                + "</details>"
+            )
+        
+        st.markdown("\n".join(parts), unsafe_allow_html=True)
     
     def _render_evidence_citations(self, citations: List[str]) -> None:
         """Render evidence citations"""
         st.subheader("📚 Evidence Citations")
-        for i, citation in enumerate(citations, 1):
-            st.write(f"{i}. [{citation}]({citation})")
+        st.markdown("\n".join(
+            f"{i}. [{citation}]({citation})" for i, citation in enumerate(citations, 1)
+        ))
     
     def _render_metrics(self, metadata: Dict[str, Any]) -> None:
         """Render simple metrics"""
+        items = []
         if 'processing_time_seconds' in metadata:
-            st.metric("Processing Time", f"{metadata['processing_time_seconds']:.2f}s")
+            items.append(("Processing Time", f"{metadata['processing_time_seconds']:.2f}s"))
         if 'confidence_score' in metadata:
-            st.metric("Confidence", f"{metadata['confidence_score']:.2%}")
+            items.append(("Confidence", f"{metadata['confidence_score']:.2%}"))
+        
+        self._render_metric_grid(items, columns=1)
+    
+    def _render_metric_grid(self, items: List[Tuple[str, Any]], columns: int) -> None:
+        """Render label/value pairs as a single grid of metric cards"""
+        if not items:
+            return
+        
+        cards = "".join(
+            f'<div class="metric-card"><div>{escape(label)}</div>'
+            f'<div style="font-size:1.5rem">{escape(str(value))}</div></div>'
+            for label, value in items
+        )
+        st.markdown(
+            f'<div style="display:grid;grid-template-columns:repeat({columns},1fr);gap:.5rem">'
+            f'{cards}</div>',
+            unsafe_allow_html=True
+        )
     
     def _render_detailed_metadata(self, metadata: Dict[str, Any]) -> None:
         """Render detailed metadata"""
@@ -1,12 +1,8 @@
 import streamlit as st
 
-class AppStyles:
-    """Clase para manejar todos los estilos CSS de la app (SRP)"""
-    
-    @staticmethod
-    def load_custom_css() -> None:
-        """Load custom CSS styles"""
-        st.markdown("""
+# Built once at import; emitted on every run because Streamlit drops any
+# element (including this <style> block) that a rerun doesn't re-render
+_CSS = """
         <style>
             .main-header {
                 font-size: 3rem;
@@ -111,6 +107,17 @@ class AppStyles:
                 background-color: #f2f9f2;
             }
             
+            details[class^="priority-"] {
+                border-radius: 0.375rem;
+                padding: 0.5rem 1rem;
+                margin: 0.5rem 0;
+            }
+            
+            details[class^="priority-"] summary {
+                cursor: pointer;
+                font-weight: 500;
+            }
+            
             .footer {
                 text-align: center;
                 color: #7f8c8d;
@@ -159,7 +166,24 @@ class AppStyles:
                 border-bottom: 2px solid #3498db;
             }
         </style>
-        """, unsafe_allow_html=True)
+        """
+
+
+_FOOTER_HTML = """
+            <div class="footer">
+                Medical AI Assistant - Technical Demo<br>
+                ⚠️ For demonstration purposes only. Not for actual medical use.
+            </div>
+            """
+
+
+class AppStyles:
+    """Clase para manejar todos los estilos CSS de la app (SRP)"""
+    
+    @staticmethod
+    def load_custom_css() -> None:
+        """Load custom CSS styles"""
+        st.markdown(_CSS, unsafe_allow_html=True)
     
     @staticmethod
     def render_header(title: str) -> None:
@@ -175,15 +199,7 @@ class AppStyles:
     def render_footer() -> None:
         """Render footer"""
         st.markdown("---")
-        st.markdown(
-            """
-            <div class="footer">
-                Medical AI Assistant - Technical Demo<br>
-                ⚠️ For demonstration purposes only. Not for actual medical use.
-            </div>
-            """, 
-            unsafe_allow_html=True
-        )
+        st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
     
     @staticmethod
     def render_processing_step(message: str) -> None:
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import Optional
 
@@ -16,30 +17,48 @@ class AppConfig:
     
     # Firebase
     max_instances: int = 10
+    function_concurrency: int = 6  # per instance; each request may buffer a 50 MB download in 1 GiB
     
     # OpenAI 
     openai_api_key: str = ""
     audio_processor_type: str = "openai"
     medical_model: str = "gpt-4"
     max_symptoms: int = 5
+    llm_cache_size: int = 256  # per-instance LRU entries; 0 disables
+    openai_json_mode: bool = False  # structured outputs; needs a model that supports them
+    max_concurrent_llm: int = 4  # in-flight calls per provider service, per instance; below function_concurrency
     
     # Perplexity
     perplexity_api_key: str = ""
     perplexity_model: str = "sonar"
     
     @classmethod
+    @lru_cache(maxsize=1)
     def from_environment(cls) -> 'AppConfig':
-        """Create configuration from environment variables"""
-        return cls(
-            download_timeout=int(os.getenv('DOWNLOAD_TIMEOUT', cls.download_timeout)),
-            max_file_size_mb=int(os.getenv('MAX_FILE_SIZE_MB', cls.max_file_size_mb)),
-            max_audio_duration=int(os.getenv('MAX_AUDIO_DURATION', cls.max_audio_duration)),
-            log_level=os.getenv('LOG_LEVEL', cls.log_level),
-            max_instances=int(os.getenv('MAX_INSTANCES', cls.max_instances)),
-            openai_api_key=os.getenv('OPENAI_API_KEY', cls.openai_api_key),
-            audio_processor_type=os.getenv('AUDIO_PROCESSOR_TYPE', cls.audio_processor_type),
-            medical_model=os.getenv('MEDICAL_MODEL', cls.medical_model),
-            max_symptoms=int(os.getenv('MAX_SYMPTOMS', cls.max_symptoms)),
-            perplexity_api_key=os.getenv('PERPLEXITY_API_KEY', cls.perplexity_api_key),
-            perplexity_model=os.getenv('PERPLEXITY_MODEL', cls.perplexity_model),
-        )
\ No newline at end of file
+        """Create configuration from environment variables (built once per process)"""
+        env = os.environ
+        config = cls(
+            download_timeout=int(env.get('DOWNLOAD_TIMEOUT', cls.download_timeout)),
+            max_file_size_mb=int(env.get('MAX_FILE_SIZE_MB', cls.max_file_size_mb)),
+            max_audio_duration=int(env.get('MAX_AUDIO_DURATION', cls.max_audio_duration)),
+            log_level=env.get('LOG_LEVEL', cls.log_level),
+            max_instances=int(env.get('MAX_INSTANCES', cls.max_instances)),
+            function_concurrency=int(env.get('FUNCTION_CONCURRENCY', cls.function_concurrency)),
+            openai_api_key=env.get('OPENAI_API_KEY', cls.openai_api_key),
+            audio_processor_type=env.get('AUDIO_PROCESSOR_TYPE', cls.audio_processor_type),
+            medical_model=env.get('MEDICAL_MODEL', cls.medical_model),
+            max_symptoms=int(env.get('MAX_SYMPTOMS', cls.max_symptoms)),
+            llm_cache_size=int(env.get('LLM_CACHE_SIZE', cls.llm_cache_size)),
+            max_concurrent_llm=int(env.get('MAX_CONCURRENT_LLM', cls.max_concurrent_llm)),
+            openai_json_mode=env.get('OPENAI_JSON_MODE', '').lower() in ('1', 'true', 'yes'),
+            perplexity_api_key=env.get('PERPLEXITY_API_KEY', cls.perplexity_api_key),
+            perplexity_model=env.get('PERPLEXITY_MODEL', cls.perplexity_model),
+        )
+        
+        # A semaphore as wide as the request concurrency never blocks
+        if config.max_concurrent_llm >= config.function_concurrency:
+            raise ValueError(
+                f"MAX_CONCURRENT_LLM ({config.max_concurrent_llm}) must be lower "
+                f"than FUNCTION_CONCURRENCY ({config.function_concurrency})"
+            )
+        return config
\ No newline at end of file
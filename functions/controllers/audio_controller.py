@@ -19,11 +19,15 @@ class AudioController:
         self.response_formatter = response_formatter
         self.logger = logging.getLogger(__name__)
     
+    def is_ready(self) -> bool:
+        """Whether audio can be transcribed (processor configured)"""
+        return self.audio_processor.is_ready()
+    
     def health_check(self) -> flask.Response:
         """Health check endpoint"""
         health_data = {
             "status": "healthy",
-            "processor_ready": self.audio_processor.is_ready(),
+            "processor_ready": self.is_ready(),
             "timestamp": time.time()
         }
         
@@ -32,26 +36,19 @@ class AudioController:
     def process_audio_from_link(self, input_data: AudioLinkInput) -> flask.Response:
         """Process audio from URL"""
         start_time = time.time()
-        temp_file_path: Optional[str] = None  
         
         try:
-            self.logger.info(f"Processing audio from: {input_data.audio_url}")
-            
-            # Download file
-            temp_file_path = self.file_downloader.download(
-                str(input_data.audio_url), 
-                max_size_mb=50
-            )
+            self.logger.info("Processing audio from: %s", input_data.audio_url)
             
-            # Process with audio processor
-            processing_result = self.audio_processor.process_audio(
-                temp_file_path,
-                input_data.language,
-                input_data.max_duration
-            )
+            # Fail fast before spending time on a download we can't process
+            if not self.is_ready():
+                return self.response_formatter.error_response(
+                    "Audio processor not configured",
+                    status_code=503,
+                    error_code="service_unavailable"
+                )
             
-            # Create structured result
-            result = AudioProcessingResult(**processing_result)
+            result = self.transcribe(input_data)
             
             # Metadata
             metadata = {
@@ -61,12 +58,12 @@ class AudioController:
             
             self.logger.info("Audio processed successfully")
             return self.response_formatter.success_response(
-                result.dict(), 
+                result.model_dump(mode="json"), 
                 metadata
             )
             
         except ValueError as e:
-            self.logger.error(f"Validation error: {str(e)}")
+            self.logger.error("Validation error: %s", e)
             return self.response_formatter.error_response(
                 str(e), 
                 status_code=400,
@@ -74,14 +71,27 @@ class AudioController:
             )
             
         except Exception as e:
-            self.logger.error(f"Internal error: {str(e)}")
+            self.logger.error("Internal error: %s", e)
             return self.response_formatter.error_response(
                 "Internal server error",
                 status_code=500,
                 error_code="internal_error"
             )
-            
-        finally:  # Always executes whether there's an error or not
-            # Clean up temporary file
-            if temp_file_path:
-                self.file_downloader.cleanup(temp_file_path)
\ No newline at end of file
+    
+    def transcribe(self, input_data: AudioLinkInput) -> AudioProcessingResult:
+        """Download and transcribe audio; raises ValueError on bad input"""
+        # Download into memory; no temp file to clean up
+        audio_source = self.file_downloader.download_stream(
+            str(input_data.audio_url), 
+            max_size_mb=50
+        )
+        
+        # Process with audio processor
+        processing_result = self.audio_processor.process_audio(
+            audio_source,
+            input_data.language,
+            input_data.max_duration
+        )
+        
+        # Create structured result
+        return AudioProcessingResult(**processing_result)
\ No newline at end of file
@@ -1,6 +1,6 @@
 import time
 import logging
-from typing import Optional
+from typing import Optional, Tuple, Dict, Any
 import flask
 from models.diagnosis_models import DiagnosisGenerationInput, DiagnosisGenerationResult
 from interfaces.diagnosis_generator import DiagnosisGeneratorInterface, TreatmentRecommenderInterface
@@ -23,61 +23,22 @@ class DiagnosisController:
         start_time = time.time()
         
         try:
-            self.logger.info("Starting complete diagnosis generation process")
-            
-            # Step 1: Generate diagnoses with ICD-10 codes using GPT-4
-            self.logger.info("Generating diagnoses with ICD-10 codes")
-            diagnoses = self.diagnosis_generator.generate_diagnosis_with_icd10(
-                input_data.medical_info, 
-                input_data.max_diagnoses
-            )
-            
-            if not diagnoses:
-                raise ValueError("No diagnoses could be generated from the provided medical information")
-            
-            # Primary diagnosis is the first 
-            primary_diagnosis = diagnoses[0]
-            differential_diagnoses = diagnoses[1:] if input_data.include_differential else []
-            
-            self.logger.info(f"Generated primary diagnosis: {primary_diagnosis.diagnosis_name} ({primary_diagnosis.icd_10_code.code})")
-            
-            # Step 2: Get treatment recommendations using Perplexity
-            self.logger.info("Getting treatment recommendations from Perplexity")
-            patient_age = input_data.medical_info.patient_info.age or None
-            patient_gender = input_data.medical_info.patient_info.gender
-            
-            treatment_recommendations, citations = self.treatment_recommender.get_treatment_recommendations(
-                primary_diagnosis,
-                patient_age,
-                patient_gender
-            )
-            
-            # Create complete result
-            result = DiagnosisGenerationResult(
-                primary_diagnosis=primary_diagnosis,
-                differential_diagnoses=differential_diagnoses,
-                treatment_plan=treatment_recommendations,
-                evidence_citations=citations
-            )
+            result, diagnosis_metadata = self.build_diagnosis(input_data)
             
             # Metadata
             metadata = {
                 "processing_time_seconds": round(time.time() - start_time, 2),
-                "diagnoses_generated": len(diagnoses),
-                "treatment_recommendations": len(treatment_recommendations),
-                "evidence_citations": len(citations),
-                "primary_diagnosis_confidence": primary_diagnosis.confidence_score,
-                "icd_10_code": primary_diagnosis.icd_10_code.code
+                **diagnosis_metadata
             }
             
             self.logger.info("Complete diagnosis generation completed successfully")
             return self.response_formatter.success_response(
-                result.dict(), 
+                result.model_dump(mode="json"), 
                 metadata
             )
             
         except ValueError as e:
-            self.logger.error(f"Validation error in diagnosis generation: {str(e)}")
+            self.logger.error("Validation error in diagnosis generation: %s", e)
             return self.response_formatter.error_response(
                 str(e), 
                 status_code=400,
@@ -85,9 +46,59 @@ class DiagnosisController:
             )
             
         except Exception as e:
-            self.logger.error(f"Internal error in diagnosis generation: {str(e)}")
+            self.logger.error("Internal error in diagnosis generation: %s", e)
             return self.response_formatter.error_response(
                 "Internal server error during diagnosis generation",
                 status_code=500,
                 error_code="internal_error"
-            )
\ No newline at end of file
+            )
+    
+    def build_diagnosis(self, input_data: DiagnosisGenerationInput) -> Tuple[DiagnosisGenerationResult, Dict[str, Any]]:
+        """Run diagnosis + treatment steps; returns the result and its metadata"""
+        self.logger.info("Starting complete diagnosis generation process")
+        
+        # Step 1: Generate diagnoses with ICD-10 codes using GPT-4
+        self.logger.info("Generating diagnoses with ICD-10 codes")
+        diagnoses = self.diagnosis_generator.generate_diagnosis_with_icd10(
+            input_data.medical_info, 
+            input_data.max_diagnoses
+        )
+        
+        if not diagnoses:
+            raise ValueError("No diagnoses could be generated from the provided medical information")
+        
+        # Primary diagnosis is the first 
+        primary_diagnosis = diagnoses[0]
+        differential_diagnoses = diagnoses[1:] if input_data.include_differential else []
+        
+        self.logger.info("Generated primary diagnosis: %s (%s)",
+                         primary_diagnosis.diagnosis_name, primary_diagnosis.icd_10_code.code)
+        
+        # Step 2: Get treatment recommendations using Perplexity
+        self.logger.info("Getting treatment recommendations from Perplexity")
+        patient_age = input_data.medical_info.patient_info.age or None
+        patient_gender = input_data.medical_info.patient_info.gender
+        
+        treatment_recommendations, citations = self.treatment_recommender.get_treatment_recommendations(
+            primary_diagnosis,
+            patient_age,
+            patient_gender
+        )
+        
+        # Create complete result
+        result = DiagnosisGenerationResult(
+            primary_diagnosis=primary_diagnosis,
+            differential_diagnoses=differential_diagnoses,
+            treatment_plan=treatment_recommendations,
+            evidence_citations=citations
+        )
+        
+        metadata = {
+            "diagnoses_generated": len(diagnoses),
+            "treatment_recommendations": len(treatment_recommendations),
+            "evidence_citations": len(citations),
+            "primary_diagnosis_confidence": primary_diagnosis.confidence_score,
+            "icd_10_code": primary_diagnosis.icd_10_code.code
+        }
+        
+        return result, metadata
\ No newline at end of file
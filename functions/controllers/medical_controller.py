@@ -21,7 +21,7 @@ class MedicalController:
         start_time = time.time()
         
         try:
-            self.logger.info(f"Extracting medical information from text: {input_data.text[:100]}...")
+            self.logger.info("Extracting medical information from text: %.100s...", input_data.text)
             
             # Extract medical information
             extraction_result = self.medical_extractor.extract_medical_info(input_data.text)
@@ -35,12 +35,12 @@ class MedicalController:
             
             self.logger.info("Medical information extracted successfully")
             return self.response_formatter.success_response(
-                extraction_result.dict(), 
+                extraction_result.model_dump(mode="json"), 
                 metadata
             )
             
         except ValueError as e:
-            self.logger.error(f"Validation error: {str(e)}")
+            self.logger.error("Validation error: %s", e)
             return self.response_formatter.error_response(
                 str(e), 
                 status_code=400,
@@ -48,7 +48,7 @@ class MedicalController:
             )
             
         except Exception as e:
-            self.logger.error(f"Internal error: {str(e)}")
+            self.logger.error("Internal error: %s", e)
             return self.response_formatter.error_response(
                 "Internal server error",
                 status_code=500,
@@ -0,0 +1,97 @@
+import time
+import logging
+import flask
+from models.pipeline_models import AudioPipelineInput, AudioPipelineResult
+from models.diagnosis_models import DiagnosisGenerationInput
+from interfaces.medical_extractor import MedicalExtractorInterface
+from interfaces.response_formatter import ResponseFormatterInterface
+from controllers.audio_controller import AudioController
+from controllers.diagnosis_controller import DiagnosisController
+
+class PipelineController:
+    """Controller running transcription, extraction and diagnosis in one request"""
+    
+    MIN_TEXT_LENGTH = 10  # same minimum as MedicalExtractionInput.text
+    
+    def __init__(self, 
+                 audio_controller: AudioController,
+                 medical_extractor: MedicalExtractorInterface,
+                 diagnosis_controller: DiagnosisController,
+                 response_formatter: ResponseFormatterInterface):
+        self.audio_controller = audio_controller
+        self.medical_extractor = medical_extractor
+        self.diagnosis_controller = diagnosis_controller
+        self.response_formatter = response_formatter
+        self.logger = logging.getLogger(__name__)
+    
+    def process_audio_pipeline(self, input_data: AudioPipelineInput) -> flask.Response:
+        """Audio URL -> transcription -> medical extraction -> diagnosis"""
+        start_time = time.time()
+        
+        try:
+            self.logger.info("Running full pipeline for: %s", input_data.audio_url)
+            
+            if not self.audio_controller.is_ready():
+                return self.response_formatter.error_response(
+                    "Audio processor not configured",
+                    status_code=503,
+                    error_code="service_unavailable"
+                )
+            
+            # Step 1: Transcription
+            transcription = self.audio_controller.transcribe(input_data)
+            text = transcription.transcription
+            if len(text.strip()) < self.MIN_TEXT_LENGTH:
+                raise ValueError("Transcription too short for medical extraction")
+            
+            # Step 2: Extraction, fed the transcription directly
+            extraction = self.medical_extractor.extract_medical_info(text)
+            
+            metadata = {
+                "input_url": str(input_data.audio_url),
+                "text_length": len(text),
+                "symptoms_found": len(extraction.symptoms)
+            }
+            
+            # Step 3: Diagnosis (nothing to diagnose without symptoms)
+            diagnosis = None
+            if extraction.symptoms:
+                # Already-validated models; skip re-validation
+                diagnosis_input = DiagnosisGenerationInput.model_construct(
+                    medical_info=extraction,
+                    include_differential=input_data.include_differential,
+                    max_diagnoses=input_data.max_diagnoses
+                )
+                diagnosis, diagnosis_metadata = self.diagnosis_controller.build_diagnosis(diagnosis_input)
+                metadata.update(diagnosis_metadata)
+            else:
+                metadata["skipped"] = "diagnosis"
+            
+            result = AudioPipelineResult.model_construct(
+                transcription=transcription,
+                extraction=extraction,
+                diagnosis=diagnosis
+            )
+            metadata["processing_time_seconds"] = round(time.time() - start_time, 2)
+            
+            self.logger.info("Pipeline completed successfully")
+            return self.response_formatter.success_response(
+                result.model_dump(mode="json"), 
+                metadata
+            )
+            
+        except ValueError as e:
+            self.logger.error("Validation error in pipeline: %s", e)
+            return self.response_formatter.error_response(
+                str(e), 
+                status_code=400,
+                error_code="validation_error"
+            )
+            
+        except Exception as e:
+            self.logger.error("Internal error in pipeline: %s", e)
+            return self.response_formatter.error_response(
+                "Internal server error during pipeline processing",
+                status_code=500,
+                error_code="internal_error"
+            )
\ No newline at end of file
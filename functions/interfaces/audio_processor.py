@@ -1,13 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union, BinaryIO
 
 class AudioProcessorInterface(ABC):
     """Interface for audio processors"""
     
     @abstractmethod
-    def process_audio(self, file_path: str, language: Optional[str] = None, 
+    def process_audio(self, file_path: Union[str, BinaryIO], language: Optional[str] = None, 
                      max_duration: int = 300) -> Dict[str, Any]:
-        """Process audio file and return transcription"""
+        """Process audio file (path or open binary stream) and return transcription"""
         pass
     
     @abstractmethod
@@ -1,14 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import BinaryIO
 
 class FileDownloaderInterface(ABC):
     """Interface for file downloaders"""
     
     @abstractmethod
-    def download(self, url: str, max_size_mb: int = 50) -> str:
-        """Download file and return temporary path"""
-        pass
-    
-    @abstractmethod
-    def cleanup(self, file_path: str) -> None:
-        """Clean up temporary file"""
+    def download_stream(self, url: str, max_size_mb: int = 50) -> BinaryIO:
+        """Download file into memory and return a readable stream"""
         pass
\ No newline at end of file
@@ -1,5 +1,6 @@
 # Firebase + Flask
 import flask
+from flask_compress import Compress
 from firebase_functions import https_fn
 from firebase_functions.options import set_global_options
 from firebase_admin import initialize_app
@@ -22,11 +23,15 @@ from services.json_response_formatter import JSONResponseFormatter
 from services.openai_medical_extractor import OpenAIMedicalExtractor
 from services.openai_diagnosis_generator import OpenAIDiagnosisGenerator
 from services.perplexity_treatment_recommender import PerplexityTreatmentRecommender
+from services.cached_medical_extractor import CachedMedicalExtractor
+from services.cached_diagnosis_generator import CachedDiagnosisGenerator
+from services.cached_treatment_recommender import CachedTreatmentRecommender
 
 # Controllers and middleware
 from controllers.audio_controller import AudioController
 from controllers.medical_controller import MedicalController
 from controllers.diagnosis_controller import DiagnosisController
+from controllers.pipeline_controller import PipelineController
 from middleware.validation_middleware import ValidationMiddleware
 from middleware.error_handler_middleware import ErrorHandlerMiddleware
 
@@ -35,122 +40,93 @@ from middleware.error_handler_middleware import ErrorHandlerMiddleware
 from models.audio_models import AudioLinkInput
 from models.medical_models import MedicalExtractionInput
 from models.diagnosis_models import DiagnosisGenerationInput
+from models.pipeline_models import AudioPipelineInput
 
 #APIKEY
 import os
-from dotenv import load_dotenv
-load_dotenv()
+# Deployed functions (K_SERVICE set by Cloud Run) already have their env;
+# only read .env when running locally
+if not os.getenv("K_SERVICE"):
+    from dotenv import load_dotenv
+    load_dotenv()
 
 class DependencyContainer:
     """Dependency Injection"""
     
     def __init__(self, config: AppConfig):
         self.config = config
-        self._audio_processor: AudioProcessorInterface = None
-        self._file_downloader: FileDownloaderInterface = None
-        self._response_formatter: ResponseFormatterInterface = None
-        self._audio_controller: AudioController = None
         
-        self._validation_middleware: ValidationMiddleware = None
+        # Built once, in dependency order, as plain attributes
+        self.response_formatter: ResponseFormatterInterface = JSONResponseFormatter()
+        self.validation_middleware = ValidationMiddleware(self.response_formatter)
         
-        self._medical_extractor: MedicalExtractorInterface = None
-        self._medical_controller: MedicalController = None
+        self.audio_processor: AudioProcessorInterface = OpenAIAudioProcessor(
+            api_key=config.openai_api_key,
+            max_concurrent_requests=config.max_concurrent_llm
+        )
+        self.file_downloader: FileDownloaderInterface = HTTPFileDownloader(
+            timeout=config.download_timeout
+        )
+        self.audio_controller = AudioController(
+            self.audio_processor,
+            self.file_downloader,
+            self.response_formatter
+        )
         
-        self._diagnosis_controller: DiagnosisController = None
-        self._treatment_recommender: TreatmentRecommenderInterface = None
-        self._diagnosis_generator: DiagnosisGeneratorInterface = None
-        
-    @property
-    def audio_processor(self) -> AudioProcessorInterface:
-        if self._audio_processor is None:
-            self._audio_processor = OpenAIAudioProcessor(
-                api_key=self.config.openai_api_key
-            )
-        return self._audio_processor
-        
-    @property
-    def file_downloader(self) -> FileDownloaderInterface:
-        if self._file_downloader is None:
-            self._file_downloader = HTTPFileDownloader(
-                timeout=self.config.download_timeout
-            )
-        return self._file_downloader
-    
-    @property
-    def response_formatter(self) -> ResponseFormatterInterface:
-        if self._response_formatter is None:
-            self._response_formatter = JSONResponseFormatter()
-        return self._response_formatter
-    
-    @property
-    def audio_controller(self) -> AudioController:
-        if self._audio_controller is None:
-            self._audio_controller = AudioController(
-                self.audio_processor,
-                self.file_downloader,
-                self.response_formatter
-            )
-        return self._audio_controller
-    
-    @property
-    def validation_middleware(self) -> ValidationMiddleware:
-        if self._validation_middleware is None:
-            self._validation_middleware = ValidationMiddleware(
-                self.response_formatter
-            )
-        return self._validation_middleware
-
-    @property
-    def medical_extractor(self) -> MedicalExtractorInterface:
-        if self._medical_extractor is None:
-            self._medical_extractor = OpenAIMedicalExtractor(
-                api_key=self.config.openai_api_key,
-                model=self.config.medical_model
-            )
-        return self._medical_extractor
-    
-    @property
-    def medical_controller(self) -> MedicalController:
-        if self._medical_controller is None:
-            self._medical_controller = MedicalController(
+        self.medical_extractor: MedicalExtractorInterface = OpenAIMedicalExtractor(
+            api_key=config.openai_api_key,
+            model=config.medical_model,
+            json_mode=config.openai_json_mode,
+            max_concurrent_requests=config.max_concurrent_llm
+        )
+        if config.llm_cache_size > 0:
+            self.medical_extractor = CachedMedicalExtractor(
                 self.medical_extractor,
-                self.response_formatter
+                maxsize=config.llm_cache_size
             )
-        return self._medical_controller
-
-    @property
-    def diagnosis_generator(self) -> DiagnosisGeneratorInterface:
-        if self._diagnosis_generator is None:
-            self._diagnosis_generator = OpenAIDiagnosisGenerator(
-                api_key=self.config.openai_api_key,
-                model=self.config.medical_model
-            )
-        return self._diagnosis_generator
-    
-    @property
-    def treatment_recommender(self) -> TreatmentRecommenderInterface:
-        if self._treatment_recommender is None:
-            self._treatment_recommender = PerplexityTreatmentRecommender(
-                api_key=self.config.perplexity_api_key,
-                model="sonar"  # Cambiar a modelo que funciona
-            )
-        return self._treatment_recommender
-    
-    @property
-    def diagnosis_controller(self) -> DiagnosisController:
-        if self._diagnosis_controller is None:
-            self._diagnosis_controller = DiagnosisController(
+        self.medical_controller = MedicalController(
+            self.medical_extractor,
+            self.response_formatter
+        )
+        
+        self.diagnosis_generator: DiagnosisGeneratorInterface = OpenAIDiagnosisGenerator(
+            api_key=config.openai_api_key,
+            model=config.medical_model,
+            json_mode=config.openai_json_mode,
+            max_concurrent_requests=config.max_concurrent_llm
+        )
+        if config.llm_cache_size > 0:
+            self.diagnosis_generator = CachedDiagnosisGenerator(
                 self.diagnosis_generator,
+                maxsize=config.llm_cache_size
+            )
+        self.treatment_recommender: TreatmentRecommenderInterface = PerplexityTreatmentRecommender(
+            api_key=config.perplexity_api_key,
+            model="sonar",  # Cambiar a modelo que funciona
+            max_concurrent_requests=config.max_concurrent_llm
+        )
+        if config.llm_cache_size > 0:
+            self.treatment_recommender = CachedTreatmentRecommender(
                 self.treatment_recommender,
-                self.response_formatter
+                maxsize=config.llm_cache_size
             )
-        return self._diagnosis_controller   
+        self.diagnosis_controller = DiagnosisController(
+            self.diagnosis_generator,
+            self.treatment_recommender,
+            self.response_formatter
+        )
+        
+        self.pipeline_controller = PipelineController(
+            self.audio_controller,
+            self.medical_extractor,
+            self.diagnosis_controller,
+            self.response_formatter
+        )
 
-def create_app() -> flask.Flask:
+def create_app(config: AppConfig) -> flask.Flask:
     """Create Flask App"""
     
     # configuration
-    config = AppConfig.from_environment()
     Logger.setup_logging(config.log_level)
     
     # Dependency containers
@@ -162,6 +138,12 @@ def create_app() -> flask.Flask:
     # Error Handler Middleware
     ErrorHandlerMiddleware(app, container.response_formatter)
     
+    # Response compression (diagnosis payloads are large, repetitive text)
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_STREAMS'] = False
+    Compress(app)
+    
     # endpoints
     @app.get("/")
     def home():
@@ -173,7 +155,8 @@ def create_app() -> flask.Flask:
                 "/health": "GET - API health status",
                 "/transcribe-audio": "POST - Transcribe audio from URL using Whisper",
                 "/extract-medical-info": "POST - Extract medical information from text using LLM",
-                "/generate-diagnosis": "POST - Generate diagnosis and treatment plan from medical data"
+                "/generate-diagnosis": "POST - Generate diagnosis and treatment plan from medical data",
+                "/process-audio-pipeline": "POST - Run transcription, extraction and diagnosis in one call"
             },
             "pipeline": {
                 "step_1": "Audio Transcription - Convert audio to text",
@@ -214,6 +197,14 @@ def create_app() -> flask.Flask:
                         "include_differential": True,
                         "max_diagnoses": 3
                     }
+                },
+                "full_pipeline": {
+                    "endpoint": "/process-audio-pipeline",
+                    "method": "POST",
+                    "body": {"audio_url": "https://example.com/audio.wav",
+                             "language": "english",
+                             "include_differential": True,
+                             "max_diagnoses": 3}
                 }
             }
         })
@@ -246,6 +237,14 @@ def create_app() -> flask.Flask:
         validated_data: DiagnosisGenerationInput = flask.g.validated_data
         return container.diagnosis_controller.generate_complete_diagnosis(validated_data)
     
+    #Full pipeline
+    @app.post("/process-audio-pipeline")
+    @container.validation_middleware.validate_json(AudioPipelineInput)
+    def process_audio_pipeline():
+        """Functions 1-3 in a single request, passing models between stages"""
+        validated_data: AudioPipelineInput = flask.g.validated_data
+        return container.pipeline_controller.process_audio_pipeline(validated_data)
+    
     return app
 
 # Firebase Settings
@@ -254,23 +253,25 @@ set_global_options(max_instances=config.max_instances)
 initialize_app()
 
 # Create Flask app
-app = create_app()
+app = create_app(config)
 
-@https_fn.on_request(timeout_sec=540, memory=1024)
+# Requests spend almost all their time waiting on upstream LLM APIs, so let
+# each instance serve several at once (needs a full vCPU)
+@https_fn.on_request(timeout_sec=540, memory=1024, cpu=1,
+                     concurrency=config.function_concurrency)
 def api(req: https_fn.Request) -> https_fn.Response:
     """Firebase Functions + Flask"""
     try:
         with app.request_context(req.environ):
             response = app.full_dispatch_request()
             
+            # Hand the encoded body straight through; no decode/re-encode
             response_data = response.get_data()
-            if isinstance(response_data, bytes):
-                response_data = response_data.decode('utf-8')
             
             return https_fn.Response(
                 response_data,
                 status=response.status_code,
-                headers=dict(response.headers)
+                headers=list(response.headers)
             )
     except Exception as e:
         import json
@@ -41,10 +41,13 @@ class ErrorHandlerMiddleware:
         
         @self.app.errorhandler(Exception)
         def handle_generic_exception(e):
-            self.logger.exception("Unhandled error")
-            
-            # If it's an HTTP exception, maintain the status code
+            # If it's an HTTP exception, maintain the status code; client
+            # errors don't need a traceback
             if isinstance(e, HTTPException):
+                if e.code is not None and e.code < 500:
+                    self.logger.info("HTTP %s: %s", e.code, e.description)
+                else:
+                    self.logger.exception("Unhandled HTTP error")
                 return self.response_formatter.error_response(
                     str(e.description),
                     status_code=e.code,
@@ -52,6 +55,7 @@ class ErrorHandlerMiddleware:
                 )
             
             # For internal errors
+            self.logger.exception("Unhandled error")
             return self.response_formatter.error_response(
                 "Internal server error",
                 status_code=500,
@@ -12,6 +12,9 @@ class ValidationMiddleware:
     
     def validate_json(self, model_class: Type[BaseModel]) -> Callable:
         """Decorator to validate JSON with Pydantic"""
+        # Bound once per endpoint at decoration time, not per request
+        validate = model_class.model_validate_json
+        
         def decorator(func: Callable) -> Callable:
             @wraps(func)
             def wrapper(*args, **kwargs):
@@ -23,19 +26,26 @@ class ValidationMiddleware:
                     )
                 
                 try:
-                    json_data = flask.request.get_json()
-                    if not json_data:
+                    # Parse and validate the raw bytes in one pass (pydantic-core)
+                    raw_body = flask.request.get_data(cache=False)
+                    if not raw_body.strip():
                         return self.response_formatter.error_response(
                             "JSON body required",
                             status_code=400,
                             error_code="empty_body"
                         )
                     
-                    validated_data = model_class(**json_data)
+                    validated_data = validate(raw_body)
                     flask.g.validated_data = validated_data
                     return func(*args, **kwargs)
                     
                 except ValidationError as e:
+                    if any(error['type'] == 'json_invalid' for error in e.errors()):
+                        return self.response_formatter.error_response(
+                            f"Error processing JSON: {str(e)}",
+                            status_code=400,
+                            error_code="json_error"
+                        )
                     return self.response_formatter.error_response(
                         f"Invalid data: {str(e)}",
                         status_code=422,
@@ -1,7 +1,9 @@
-from pydantic import BaseModel, HttpUrl, Field, validator
+from pydantic import BaseModel, HttpUrl, Field, validator, field_validator
 from typing import Optional
 from datetime import datetime
 
+_ALLOWED_LANGUAGES = frozenset(('spanish', 'english', 'french', 'german', 'italian'))
+
 class AudioLinkInput(BaseModel):
     """Model for audio processing input"""
     audio_url: HttpUrl = Field(..., description="Audio file URL")
@@ -9,13 +11,14 @@ class AudioLinkInput(BaseModel):
     max_duration: Optional[int] = Field(300, ge=1, le=1800, 
                                        description="Maximum duration in seconds")
     
-    @validator('language')
+    @field_validator('language', mode='after')
+    @classmethod
     def validate_language(cls, v):
         if v is not None:
-            allowed_languages = ['spanish', 'english', 'french', 'german', 'italian']
-            if v.lower() not in allowed_languages:
-                raise ValueError(f'Language must be one of: {allowed_languages}')
-        return v.lower() if v else v
+            v = v.lower()
+            if v not in _ALLOWED_LANGUAGES:
+                raise ValueError(f'Language must be one of: {sorted(_ALLOWED_LANGUAGES)}')
+        return v
     
     class Config:
         json_schema_extra = {
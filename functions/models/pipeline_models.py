@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from models.audio_models import AudioLinkInput, AudioProcessingResult
+from models.medical_models import MedicalExtractionResult
+from models.diagnosis_models import DiagnosisGenerationResult
+
+class AudioPipelineInput(AudioLinkInput):
+    """Input for the full audio -> extraction -> diagnosis pipeline"""
+    include_differential: bool = Field(True, description="Include differential diagnoses")
+    max_diagnoses: int = Field(3, ge=1, le=5, description="Maximum number of diagnoses to generate")
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "audio_url": "https://example.com/audio.mp3",
+                "language": "english",
+                "include_differential": True,
+                "max_diagnoses": 3
+            }
+        }
+
+class AudioPipelineResult(BaseModel):
+    """Results of every pipeline stage"""
+    transcription: AudioProcessingResult
+    extraction: MedicalExtractionResult
+    diagnosis: Optional[DiagnosisGenerationResult] = Field(None, description="Missing when no symptoms were found")
\ No newline at end of file
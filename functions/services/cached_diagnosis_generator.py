@@ -0,0 +1,35 @@
+import hashlib
+import logging
+from typing import List
+from interfaces.diagnosis_generator import DiagnosisGeneratorInterface
+from models.diagnosis_models import Diagnosis
+from models.medical_models import MedicalExtractionResult
+from utils.lru_cache import LRUCache
+
+class CachedDiagnosisGenerator(DiagnosisGeneratorInterface):
+    """Caching decorator for diagnosis generators (OCP)"""
+    
+    def __init__(self, generator: DiagnosisGeneratorInterface, maxsize: int = 256):
+        self.generator = generator
+        self._cache = LRUCache(maxsize)
+        self.logger = logging.getLogger(__name__)
+    
+    def generate_diagnosis_with_icd10(self, medical_info: MedicalExtractionResult, 
+                                     max_diagnoses: int = 3) -> List[Diagnosis]:
+        """Return cached diagnoses for identical medical info, else delegate"""
+        hasher = hashlib.blake2b(medical_info.model_dump_json().encode('utf-8'), digest_size=16)
+        hasher.update(str(max_diagnoses).encode('ascii'))
+        key = hasher.digest()
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.logger.info("Diagnosis cache hit")
+            return list(cached)
+        
+        diagnoses = self.generator.generate_diagnosis_with_icd10(medical_info, max_diagnoses)
+        self._cache.set(key, list(diagnoses))
+        return diagnoses
+    
+    def is_ready(self) -> bool:
+        """Check if the wrapped generator is ready"""
+        return self.generator.is_ready()
\ No newline at end of file
@@ -0,0 +1,33 @@
+import hashlib
+import logging
+from interfaces.medical_extractor import MedicalExtractorInterface
+from models.medical_models import MedicalExtractionResult
+from utils.lru_cache import LRUCache
+
+class CachedMedicalExtractor(MedicalExtractorInterface):
+    """Caching decorator for medical extractors (OCP)"""
+    
+    def __init__(self, extractor: MedicalExtractorInterface, maxsize: int = 256):
+        self.extractor = extractor
+        self._cache = LRUCache(maxsize)
+        self.logger = logging.getLogger(__name__)
+    
+    def extract_medical_info(self, text: str) -> MedicalExtractionResult:
+        """Return the cached extraction for equivalent text, else delegate"""
+        # Whitespace-only differences (re-wrapped or pasted transcripts)
+        # share an entry; anything else is a different prompt
+        normalized = ' '.join(text.split())
+        key = hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.logger.info("Medical extraction cache hit")
+            return cached
+        
+        result = self.extractor.extract_medical_info(text)
+        self._cache.set(key, result)
+        return result
+    
+    def is_ready(self) -> bool:
+        """Check if the wrapped extractor is ready"""
+        return self.extractor.is_ready()
\ No newline at end of file
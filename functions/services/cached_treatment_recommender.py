@@ -0,0 +1,36 @@
+import logging
+from typing import List
+from interfaces.diagnosis_generator import TreatmentRecommenderInterface
+from models.diagnosis_models import Diagnosis, TreatmentRecommendation
+from utils.lru_cache import LRUCache
+
+class CachedTreatmentRecommender(TreatmentRecommenderInterface):
+    """Caching decorator for treatment recommenders (OCP)"""
+    
+    def __init__(self, recommender: TreatmentRecommenderInterface, maxsize: int = 256):
+        self.recommender = recommender
+        self._cache = LRUCache(maxsize)
+        self.logger = logging.getLogger(__name__)
+    
+    def get_treatment_recommendations(self, diagnosis: Diagnosis, 
+                                    patient_age: int, 
+                                    patient_gender: str = None) -> tuple[List[TreatmentRecommendation], List[str]]:
+        """Return cached recommendations for the same prompt inputs, else delegate"""
+        # Exactly the fields the treatment prompt is built from
+        key = (diagnosis.diagnosis_name.upper(), diagnosis.icd_10_code.code, patient_age, patient_gender)
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.logger.info("Treatment recommendation cache hit")
+            recommendations, citations = cached
+            return list(recommendations), list(citations)
+        
+        recommendations, citations = self.recommender.get_treatment_recommendations(
+            diagnosis, patient_age, patient_gender
+        )
+        self._cache.set(key, (list(recommendations), list(citations)))
+        return recommendations, citations
+    
+    def is_ready(self) -> bool:
+        """Check if the wrapped recommender is ready"""
+        return self.recommender.is_ready()
\ No newline at end of file
@@ -1,61 +1,72 @@
-import os
-import tempfile
+import io
+import shutil
 import requests
+import urllib3
 import logging
+from typing import BinaryIO
 from interfaces.file_downloader import FileDownloaderInterface
+from utils.http_session import HTTPSession
+
+logger = logging.getLogger(__name__)
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+class _LimitedReader:
+    """File-like wrapper that stops a copy once it passes max_bytes"""
+    
+    def __init__(self, raw: BinaryIO, max_bytes: int):
+        self._raw = raw
+        self._max_bytes = max_bytes
+        self.bytes_read = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.bytes_read += len(data)
+        if self.bytes_read > self._max_bytes:
+            raise ValueError("File too large during download")
+        return data
 
 class HTTPFileDownloader(FileDownloaderInterface):
     """HTTP file downloader implementation"""
     
     def __init__(self, timeout: int = 30):
         self.timeout = timeout
-        self.logger = logging.getLogger(__name__)
-        self._headers = {
+        self._session = HTTPSession.create()
+        self._session.headers.update({
             'User-Agent': 'Mozilla/5.0 (compatible; AudioProcessor/1.0)'
-        }
+        })
     
-    def download(self, url: str, max_size_mb: int = 50) -> str:
-        """Download file from URL"""
+    def download_stream(self, url: str, max_size_mb: int = 50) -> BinaryIO:
+        """Download file from URL into memory, skipping the temp file"""
         try:
-            self.logger.info(f"Downloading: {url}")
-            
-            response = requests.get(url, headers=self._headers, 
-                                  stream=True, timeout=self.timeout)
-            response.raise_for_status()
+            logger.info("Downloading to memory: %s", url)
             
-            # Check file size
-            content_length = response.headers.get('content-length')
-            if content_length and int(content_length) > max_size_mb * 1024 * 1024:
-                raise ValueError(f"File too large. Maximum: {max_size_mb}MB")
-            
-            # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-            
-            downloaded_size = 0
-            max_size_bytes = max_size_mb * 1024 * 1024
-            
-            for chunk in response.iter_content(chunk_size=8192):
-                downloaded_size += len(chunk)
-                if downloaded_size > max_size_bytes:
-                    temp_file.close()
-                    os.unlink(temp_file.name)
-                    raise ValueError(f"File too large during download")
+            # Closing the response drops the connection without reading
+            # the rest of a rejected body
+            with self._session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
                 
-                temp_file.write(chunk)
+                # Check file size
+                content_length = response.headers.get('content-length')
+                if content_length and int(content_length) > max_size_mb * 1024 * 1024:
+                    raise ValueError(f"File too large. Maximum: {max_size_mb}MB")
+                
+                # Copy in C-level 1 MiB blocks instead of a Python loop per chunk
+                buffer = io.BytesIO()
+                response.raw.decode_content = True
+                reader = _LimitedReader(response.raw, max_size_mb * 1024 * 1024)
+                shutil.copyfileobj(reader, buffer, _COPY_BUFFER_SIZE)
+                downloaded_size = reader.bytes_read
             
-            temp_file.close()
-            self.logger.info(f"File downloaded: {temp_file.name}")
-            return temp_file.name
+            buffer.seek(0)
+            # Same name the temp file path would get, so processors infer
+            # the same filename and Content-Type
+            buffer.name = 'audio.mp3'
+            logger.debug("File downloaded to memory: %d bytes", downloaded_size)
+            return buffer
             
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error downloading: {str(e)}")
-            raise ValueError(f"Download error: {str(e)}")
-    
-    def cleanup(self, file_path: str) -> None:
-        """Clean up temporary file"""
-        try:
-            if os.path.exists(file_path):
-                os.unlink(file_path)
-                self.logger.info(f"File cleaned up: {file_path}")
-        except Exception as e:
-            self.logger.warning(f"Error cleaning up file {file_path}: {str(e)}")
\ No newline at end of file
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            # response.raw raises urllib3 errors (truncated body, read
+            # timeout) that iter_content used to wrap
+            logger.error("Error downloading: %s", e)
+            raise ValueError(f"Download error: {str(e)}")
\ No newline at end of file
@@ -1,8 +1,21 @@
+import time
 import flask
-from datetime import datetime, timezone
+import orjson
 from typing import Dict, Any
 from interfaces.response_formatter import ResponseFormatterInterface
 
+# (second, formatted) - response timestamps only need second precision
+_TS_CACHE = [0, ""]
+
+def _iso_now() -> str:
+    """UTC ISO-8601 timestamp, formatted at most once per second"""
+    now = int(time.time())
+    cache = _TS_CACHE
+    if cache[0] != now:
+        cache[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        cache[0] = now
+    return cache[1]
+
 class JSONResponseFormatter(ResponseFormatterInterface):
     """JSON response formatter implementation"""
     
@@ -13,12 +26,12 @@ class JSONResponseFormatter(ResponseFormatterInterface):
             "success": True,
             "result": data,
             "metadata": {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _iso_now(),
                 **(metadata or {})
             }
         }
         
-        return flask.jsonify(response_data)
+        return flask.Response(orjson.dumps(response_data), mimetype="application/json")
     
     def error_response(self, message: str, status_code: int = 400, 
                       error_code: str = None) -> flask.Response:
@@ -28,10 +41,12 @@ class JSONResponseFormatter(ResponseFormatterInterface):
             "error": {
                 "message": message,
                 "code": error_code or "generic_error",
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _iso_now()
             }
         }
         
-        response = flask.jsonify(response_data)
-        response.status_code = status_code
-        return response
\ No newline at end of file
+        return flask.Response(
+            orjson.dumps(response_data),
+            status=status_code,
+            mimetype="application/json"
+        )
\ No newline at end of file
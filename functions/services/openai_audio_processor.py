@@ -1,79 +1,109 @@
 import requests
 import os
 import logging
-from typing import Dict, Any, Optional
+import orjson
+import threading
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from typing import Dict, Any, Optional, Union, BinaryIO
 from interfaces.audio_processor import AudioProcessorInterface
+from utils.http_session import HTTPSession
+
+logger = logging.getLogger(__name__)
+
+# Language name -> ISO 639-1 code expected by Whisper
+_LANG_MAP = {
+    "spanish": "es",
+    "english": "en",
+    "french": "fr",
+    "german": "de",
+    "italian": "it"
+}
+
+_CONTENT_TYPES = {
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.mp4': 'audio/mp4',
+    '.m4a': 'audio/m4a',
+    '.ogg': 'audio/ogg',
+    '.flac': 'audio/flac',
+    '.webm': 'audio/webm',
+}
 
 class OpenAIAudioProcessor(AudioProcessorInterface):
-    def __init__(self, api_key: str, model: str = "whisper-1"):
+    def __init__(self, api_key: str, model: str = "whisper-1", max_concurrent_requests: int = 4):
         self.api_key = api_key
         self.model = model
         self.base_url = "https://api.openai.com/v1/audio/transcriptions"
-        self.logger = logging.getLogger(__name__)
+        self._semaphore = threading.BoundedSemaphore(max_concurrent_requests)
+        self._session = HTTPSession.create()
     
-    def process_audio(self, file_path: str, language: Optional[str] = None, 
+    def process_audio(self, file_path: Union[str, BinaryIO], language: Optional[str] = None, 
                      max_duration: int = 300) -> Dict[str, Any]:
         
         if not self.api_key:
             raise ValueError("OpenAI API key not configured")
         
         try:
-            self.logger.info(f"Sending audio to OpenAI API: {file_path}")
+            if isinstance(file_path, str):
+                # Verify file exists
+                if not os.path.exists(file_path):
+                    raise ValueError(f"File not found: {file_path}")
+                audio_source = open(file_path, 'rb')
+                source_name = file_path
+            else:
+                # Already-downloaded in-memory stream
+                audio_source = file_path
+                source_name = getattr(file_path, 'name', 'audio.mp3')
             
-            # Verify file exists
-            if not os.path.exists(file_path):
-                raise ValueError(f"File not found: {file_path}")
+            logger.info("Sending audio to OpenAI API: %s", source_name)
             
             # Prepare the request
-            with open(file_path, 'rb') as audio_file:
+            with audio_source as audio_file:
                 # Get base filename for Content-Type
-                content_type = self._get_content_type(file_path)
-                filename = os.path.basename(file_path)
+                content_type = self._get_content_type(source_name)
+                filename = os.path.basename(source_name)
                 
-                files = {
+                fields = {
                     'file': (filename, audio_file, content_type),
-                    'model': (None, self.model),
-                    'response_format': (None, 'json'),
+                    'model': self.model,
+                    'response_format': 'json',
                 }
                 
                 # Add language if specified
                 if language:
                     # Map languages to ISO codes
-                    lang_map = {
-                        "spanish": "es",
-                        "english": "en", 
-                        "french": "fr",
-                        "german": "de",
-                        "italian": "it"
-                    }
-                    lang_code = lang_map.get(language.lower(), language.lower()[:2])
-                    files['language'] = (None, lang_code)
+                    lang_code = _LANG_MAP.get(language.lower(), language.lower()[:2])
+                    fields['language'] = lang_code
                 
+                # Stream the multipart body in chunks instead of building it in memory
+                encoder = MultipartEncoder(fields=fields)
                 headers = {
-                    'Authorization': f'Bearer {self.api_key}'
+                    'Authorization': f'Bearer {self.api_key}',
+                    'Content-Type': encoder.content_type
                 }
                 
-                self.logger.debug(f"Request headers: {headers}")
-                self.logger.debug(f"Request files keys: {list(files.keys())}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Request fields: %s", list(fields))
                 
                 # Make the request
-                response = requests.post(
-                    self.base_url, 
-                    files=files, 
-                    headers=headers,
-                    timeout=60
-                )
+                with self._semaphore:
+                    response = self._session.post(
+                        self.base_url, 
+                        data=encoder, 
+                        headers=headers,
+                        timeout=60
+                    )
                 
-                self.logger.info(f"OpenAI API response status: {response.status_code}")
+                logger.debug("OpenAI API response status: %s", response.status_code)
                 
                 # Log error for debugging
                 if response.status_code != 200:
-                    self.logger.error(f"OpenAI API Error: {response.status_code}")
-                    self.logger.error(f"Response content: {response.text}")
+                    logger.error("OpenAI API Error: %s", response.status_code)
+                    logger.error("Response content: %s", response.text)
                     response.raise_for_status()
                 
-                result = response.json()
-                self.logger.info("Transcription completed successfully")
+                result = orjson.loads(response.content)
+                logger.info("Transcription completed successfully")
                 
                 return {
                     "transcription": result.get("text", ""),
@@ -84,30 +114,21 @@ class OpenAIAudioProcessor(AudioProcessorInterface):
     
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error in request to OpenAI: {str(e)}")
+            logger.error("Error in request to OpenAI: %s", e)
             if hasattr(e, 'response') and e.response is not None:
-                self.logger.error(f"Response content: {e.response.text}")
+                logger.error("Response content: %s", e.response.text)
             raise ValueError(f"Error communicating with OpenAI API: {str(e)}")
         
         except Exception as e:
-            self.logger.error(f"Error processing audio: {str(e)}")
+            logger.error("Error processing audio: %s", e)
             raise ValueError(f"Error in processing: {str(e)}")
 
     def _get_content_type(self, file_path: str) -> str:
         """Get correct Content-Type based on file extension"""
         ext = os.path.splitext(file_path)[1].lower()
-        content_types = {
-            '.mp3': 'audio/mpeg',
-            '.wav': 'audio/wav',
-            '.mp4': 'audio/mp4',
-            '.m4a': 'audio/m4a',
-            '.ogg': 'audio/ogg',
-            '.flac': 'audio/flac',
-            '.webm': 'audio/webm',
-        }
-        return content_types.get(ext, 'audio/mpeg')   
+        return _CONTENT_TYPES.get(ext, 'audio/mpeg')   
     
     def is_ready(self) -> bool:
         ready = bool(self.api_key)
-        self.logger.debug(f"OpenAI processor ready: {ready}")
+        logger.debug("OpenAI processor ready: %s", ready)
         return ready
\ No newline at end of file
@@ -1,19 +1,74 @@
 import requests
-import json
+import orjson
 import logging
+import threading
 from typing import List
 from interfaces.diagnosis_generator import DiagnosisGeneratorInterface
-from models.diagnosis_models import Diagnosis, ICDCode
+from utils.http_session import HTTPSession
+from utils.chat_payload import ChatPayload
+from models.diagnosis_models import Diagnosis
 from models.medical_models import MedicalExtractionResult
 
+logger = logging.getLogger(__name__)
+
 class OpenAIDiagnosisGenerator(DiagnosisGeneratorInterface):
     """Diagnosis generator using GPT-4 with ICD-10 coding"""
     
-    def __init__(self, api_key: str, model: str = "gpt-4"):
+    # Fallbacks for keys GPT occasionally omits
+    _DIAGNOSIS_DEFAULTS = {
+        "diagnosis_name": "",
+        "confidence_score": 0.5,
+        "reasoning": "",
+        "supporting_symptoms": []
+    }
+    _ICD_DEFAULTS = {"code": "", "description": "", "category": ""}
+    
+    # Static JSON-format instructions appended after the case details
+    _DIAGNOSIS_TAIL = """
+
+Provide a JSON response with exactly this structure:
+
+{
+    "diagnoses": [
+        {
+            "diagnosis_name": "Primary diagnosis name",
+            "icd_10_code": {
+                "code": "ICD-10 code (e.g., G43.1)",
+                "description": "Full ICD-10 description",
+                "category": "ICD-10 category (e.g., Diseases of the nervous system)"
+            },
+            "confidence_score": 0.85,
+            "reasoning": "Clinical reasoning explaining why this diagnosis fits the symptoms",
+            "supporting_symptoms": ["symptom1", "symptom2", "symptom3"]
+        }
+    ]
+}
+
+Order diagnoses by likelihood (most probable first). Include proper ICD-10 codes and clinical reasoning.
+Respond ONLY with valid JSON:
+"""
+    
+    def __init__(self, api_key: str, model: str = "gpt-4", json_mode: bool = False, max_concurrent_requests: int = 4):
         self.api_key = api_key
         self.model = model
         self.base_url = "https://api.openai.com/v1/chat/completions"
-        self.logger = logging.getLogger(__name__)
+        self._semaphore = threading.BoundedSemaphore(max_concurrent_requests)
+        
+        self._session = HTTPSession.create(retry_on_status=True)
+        self._session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+        
+        # JSON mode guarantees a parseable object; the prompt still spells
+        # out the diagnoses structure
+        payload_params = {"model": model, "temperature": 0.2, "max_tokens": 2000}
+        if json_mode:
+            payload_params["response_format"] = {"type": "json_object"}
+        self._payload = ChatPayload(
+            "You are an experienced physician with expertise in ICD-10 coding. Analyze medical information and provide accurate diagnoses with proper ICD-10 codes. Always respond with valid JSON only.",
+            **payload_params
+        )
     
     def generate_diagnosis_with_icd10(self, medical_info: MedicalExtractionResult, 
                                      max_diagnoses: int = 3) -> List[Diagnosis]:
@@ -23,80 +78,54 @@ class OpenAIDiagnosisGenerator(DiagnosisGeneratorInterface):
             raise ValueError("OpenAI API key not configured")
         
         try:
-            self.logger.info("Generating diagnoses with ICD-10 codes using GPT-4")
+            logger.info("Generating diagnoses with ICD-10 codes using GPT-4")
             
             # Create structured prompt for diagnosis
             prompt = self._create_diagnosis_prompt(medical_info, max_diagnoses)
             
-            response = requests.post(
-                self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are an experienced physician with expertise in ICD-10 coding. Analyze medical information and provide accurate diagnoses with proper ICD-10 codes. Always respond with valid JSON only."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.2,  
-                    "max_tokens": 2000
-                },
-                timeout=45
-            )
+            with self._semaphore:
+                response = self._session.post(
+                    self.base_url,
+                    data=self._payload.render(prompt),
+                    timeout=45
+                )
             
-            self.logger.info(f"OpenAI diagnosis API response status: {response.status_code}")
+            logger.debug("OpenAI diagnosis API response status: %s", response.status_code)
             
             if response.status_code != 200:
-                self.logger.error(f"OpenAI API Error: {response.status_code}")
-                self.logger.error(f"Response content: {response.text}")
+                logger.error("OpenAI API Error: %s", response.status_code)
+                logger.error("Response content: %s", response.text)
                 response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             content = result["choices"][0]["message"]["content"]
             
             # Parse JSON response
             try:
-                diagnosis_data = json.loads(content)
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Error parsing diagnosis JSON response: {content}")
+                diagnosis_data = orjson.loads(content)
+            except orjson.JSONDecodeError as e:
+                logger.error("Error parsing diagnosis JSON response: %s", content)
                 raise ValueError(f"GPT returned invalid JSON: {str(e)}")
             
-            # Convert to Pydantic models
-            diagnoses = []
-            for diag_data in diagnosis_data.get("diagnoses", []):
-                icd_data = diag_data.get("icd_10_code", {})
-                icd_code = ICDCode(
-                    code=icd_data.get("code", ""),
-                    description=icd_data.get("description", ""),
-                    category=icd_data.get("category", "")
-                )
-                
-                diagnosis = Diagnosis(
-                    diagnosis_name=diag_data.get("diagnosis_name", ""),
-                    icd_10_code=icd_code,
-                    confidence_score=float(diag_data.get("confidence_score", 0.5)),
-                    reasoning=diag_data.get("reasoning", ""),
-                    supporting_symptoms=diag_data.get("supporting_symptoms", [])
-                )
-                diagnoses.append(diagnosis)
+            # Convert to Pydantic models, keeping the fallbacks for missing keys
+            diagnoses = [
+                Diagnosis.model_validate({
+                    **self._DIAGNOSIS_DEFAULTS,
+                    **diag_data,
+                    "icd_10_code": {**self._ICD_DEFAULTS, **diag_data.get("icd_10_code", {})}
+                })
+                for diag_data in diagnosis_data.get("diagnoses", [])
+            ]
             
-            self.logger.info(f"Generated {len(diagnoses)} diagnoses with ICD-10 codes")
+            logger.info("Generated %d diagnoses with ICD-10 codes", len(diagnoses))
             return diagnoses
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error in OpenAI diagnosis request: {str(e)}")
+            logger.error("Error in OpenAI diagnosis request: %s", e)
             raise ValueError(f"Error communicating with OpenAI API: {str(e)}")
         
         except Exception as e:
-            self.logger.error(f"Error generating diagnoses: {str(e)}")
+            logger.error("Error generating diagnoses: %s", e)
             raise ValueError(f"Error in diagnosis generation: {str(e)}")
     
     def _create_diagnosis_prompt(self, medical_info: MedicalExtractionResult, max_diagnoses: int) -> str:
@@ -130,29 +159,7 @@ Reason for consultation: {medical_info.reason_for_consultation}
 Symptoms:
 {symptoms_text}
 
-{f"Additional notes: {medical_info.additional_notes}" if medical_info.additional_notes else ""}
-
-Provide a JSON response with exactly this structure:
-
-{{
-    "diagnoses": [
-        {{
-            "diagnosis_name": "Primary diagnosis name",
-            "icd_10_code": {{
-                "code": "ICD-10 code (e.g., G43.1)",
-                "description": "Full ICD-10 description",
-                "category": "ICD-10 category (e.g., Diseases of the nervous system)"
-            }},
-            "confidence_score": 0.85,
-            "reasoning": "Clinical reasoning explaining why this diagnosis fits the symptoms",
-            "supporting_symptoms": ["symptom1", "symptom2", "symptom3"]
-        }}
-    ]
-}}
-
-Order diagnoses by likelihood (most probable first). Include proper ICD-10 codes and clinical reasoning.
-Respond ONLY with valid JSON:
-"""
+{f"Additional notes: {medical_info.additional_notes}" if medical_info.additional_notes else ""}""" + self._DIAGNOSIS_TAIL
     
     def is_ready(self) -> bool:
         """Check if diagnosis generator is ready"""
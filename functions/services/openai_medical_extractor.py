@@ -1,18 +1,80 @@
 import requests
-import json
+import orjson
 import logging
+import threading
 from typing import Dict, Any
 from interfaces.medical_extractor import MedicalExtractorInterface
-from models.medical_models import MedicalExtractionResult, PatientInfo, Symptom
+from utils.http_session import HTTPSession
+from utils.chat_payload import ChatPayload
+from models.medical_models import MedicalExtractionResult
+
+logger = logging.getLogger(__name__)
 
 class OpenAIMedicalExtractor(MedicalExtractorInterface):
     """Medical information extractor using OpenAI"""
     
-    def __init__(self, api_key: str, model: str = "gpt-4"):
+    # Static prompt scaffold; only the medical text varies between calls
+    _EXTRACTION_HEAD = """
+Extract medical information from the following text and return a JSON with exactly this structure:
+
+{
+    "patient_info": {
+        "name": "patient name or null",
+        "age": age_number or null,
+        "identification_number": "ID or null", 
+        "gender": "gender or null"
+    },
+    "symptoms": [
+        {
+            "symptom": "symptom description",
+            "duration": "duration or null",
+            "severity": "mild/moderate/severe or null",
+            "location": "location or null"
+        }
+    ],
+    "reason_for_consultation": "main reason for consultation",
+    "additional_notes": "additional notes or null"
+}
+
+Medical text:
+"""
+    _EXTRACTION_TAIL = """
+
+Respond ONLY with valid JSON, no additional explanations:
+"""
+    
+    def __init__(self, api_key: str, model: str = "gpt-4", json_mode: bool = False, max_concurrent_requests: int = 4):
         self.api_key = api_key
         self.model = model
         self.base_url = "https://api.openai.com/v1/chat/completions"
-        self.logger = logging.getLogger(__name__)
+        self._semaphore = threading.BoundedSemaphore(max_concurrent_requests)
+        
+        # Keep-alive connection pool with the auth headers set once
+        self._session = HTTPSession.create(retry_on_status=True)
+        self._session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+        
+        # Structured outputs (gpt-4o family and newer); schema built once
+        self.json_mode = json_mode
+        self._response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "MedicalExtractionResult",
+                "schema": MedicalExtractionResult.model_json_schema(),
+                "strict": False
+            }
+        } if json_mode else None
+        
+        # Request body serialized once; only the prompt is spliced in per call
+        payload_params = {"model": model, "temperature": 0.1, "max_tokens": 1000}
+        if self._response_format:
+            payload_params["response_format"] = self._response_format
+        self._payload = ChatPayload(
+            "You are a medical assistant specialized in extracting structured information from medical texts. Respond ONLY with valid JSON following exactly the provided schema.",
+            **payload_params
+        )
     
     def extract_medical_info(self, text: str) -> MedicalExtractionResult:
         """Extract medical information from text using GPT"""
@@ -21,125 +83,66 @@ class OpenAIMedicalExtractor(MedicalExtractorInterface):
             raise ValueError("OpenAI API key not configured")
         
         try:
-            self.logger.info("Extracting medical information...")
+            logger.info("Extracting medical information...")
             
             # Crear prompt
             prompt = self._create_extraction_prompt(text)
             
             # Request to OpenAI
-            response = requests.post(
-                self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a medical assistant specialized in extracting structured information from medical texts. Respond ONLY with valid JSON following exactly the provided schema."
-                        },
-                        {
-                            "role": "user", 
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.1,  
-                    "max_tokens": 1000
-                },
-                timeout=30
-            )
+            with self._semaphore:
+                response = self._session.post(
+                    self.base_url,
+                    data=self._payload.render(prompt),
+                    timeout=30
+                )
             
-            self.logger.info(f"OpenAI API response status: {response.status_code}")
+            logger.debug("OpenAI API response status: %s", response.status_code)
             
             if response.status_code != 200:
-                self.logger.error(f"OpenAI API Error: {response.status_code}")
-                self.logger.error(f"Response content: {response.text}")
+                logger.error("OpenAI API Error: %s", response.status_code)
+                logger.error("Response content: %s", response.text)
                 response.raise_for_status()
             
             # Parse response
-            result = response.json()
+            result = orjson.loads(response.content)
             content = result["choices"][0]["message"]["content"]
             
+            # Schema-constrained output maps straight onto the model
+            if self.json_mode:
+                return MedicalExtractionResult.model_validate_json(content)
+            
             # Parse JSON from response
             try:
-                extracted_data = json.loads(content)
-            except json.JSONDecodeError as e:
-                self.logger.error(f"Error parsing JSON response: {content}")
+                extracted_data = orjson.loads(content)
+            except orjson.JSONDecodeError as e:
+                logger.error("Error parsing JSON response: %s", content)
                 raise ValueError(f"GPT returned invalid JSON: {str(e)}")
             
             # Convert to Pydantic model
             return self._parse_extraction_result(extracted_data)
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error in request to OpenAI: {str(e)}")
+            logger.error("Error in request to OpenAI: %s", e)
             raise ValueError(f"Error communicating with OpenAI API: {str(e)}")
         
         except Exception as e:
-            self.logger.error(f"Error extracting medical information: {str(e)}")
+            logger.error("Error extracting medical information: %s", e)
             raise ValueError(f"Error in extraction: {str(e)}")
     
     def _create_extraction_prompt(self, text: str) -> str:
         """Create prompt for medical extraction"""
-        return f"""
-Extract medical information from the following text and return a JSON with exactly this structure:
-
-{{
-    "patient_info": {{
-        "name": "patient name or null",
-        "age": age_number or null,
-        "identification_number": "ID or null", 
-        "gender": "gender or null"
-    }},
-    "symptoms": [
-        {{
-            "symptom": "symptom description",
-            "duration": "duration or null",
-            "severity": "mild/moderate/severe or null",
-            "location": "location or null"
-        }}
-    ],
-    "reason_for_consultation": "main reason for consultation",
-    "additional_notes": "additional notes or null"
-}}
-
-Medical text:
-{text}
-
-Respond ONLY with valid JSON, no additional explanations:
-"""
+        return self._EXTRACTION_HEAD + text + self._EXTRACTION_TAIL
     
     def _parse_extraction_result(self, data: Dict[str, Any]) -> MedicalExtractionResult:
         """Parse extraction result to Pydantic models"""
         
-        # 1- Parse patient information
-        patient_data = data.get("patient_info", {})
-        patient_info = PatientInfo(
-            name=patient_data.get("name"),
-            age=patient_data.get("age"),
-            identification_number=patient_data.get("identification_number"),
-            gender=patient_data.get("gender")
-        )
-        
-        # 2- Parse symptoms
-        symptoms = []
-        for symptom_data in data.get("symptoms", []):
-            symptom = Symptom(
-                symptom=symptom_data.get("symptom", ""),
-                duration=symptom_data.get("duration"),
-                severity=symptom_data.get("severity"),
-                location=symptom_data.get("location")
-            )
-            symptoms.append(symptom)
+        # Fill the keys GPT may leave out, then validate in one pass
+        data.setdefault("patient_info", {})
+        data.setdefault("reason_for_consultation", "")
+        for symptom_data in data.setdefault("symptoms", []):
+            symptom_data.setdefault("symptom", "")
         
-       # Create final result
-        return MedicalExtractionResult(
-            patient_info=patient_info,
-            symptoms=symptoms,
-            reason_for_consultation=data.get("reason_for_consultation", ""),
-            additional_notes=data.get("additional_notes")
-        )
+        return MedicalExtractionResult.model_validate(data)
     
     def is_ready(self) -> bool:
         """Check if the extractor is ready"""
@@ -1,18 +1,63 @@
+import re
 import requests
-import json
+import orjson
 import logging
+import threading
 from typing import List
 from interfaces.diagnosis_generator import TreatmentRecommenderInterface
+from utils.http_session import HTTPSession
+from utils.chat_payload import ChatPayload
 from models.diagnosis_models import Diagnosis, TreatmentRecommendation
 
+logger = logging.getLogger(__name__)
+
+# Body of the first ```json ... ``` block
+_JSON_FENCE_RE = re.compile(r"```json(.*?)```", re.DOTALL)
+
 class PerplexityTreatmentRecommender(TreatmentRecommenderInterface):
     """Treatment recommender using Perplexity AI"""
     
-    def __init__(self, api_key: str, model: str = "sonar"):
+    # Guideline scope and JSON format; identical for every diagnosis
+    _TREATMENT_TAIL = """
+
+Based on recent research and current clinical practice guidelines from US, Canada, and Europe (prioritize ≥2023-2025 sources: AHA/ACC, NICE, ESC, USPSTF, CDC, CADTH).
+
+Return ONLY this JSON structure:
+
+{
+    "clinical_pathway": [
+        {
+            "recommendation": "Specific clinical recommendation with dosage/details",
+            "priority": "high/medium/low",
+            "duration": "timeframe or null",
+            "notes": "evidence source and additional context"
+        }
+    ]
+}
+
+Include: initial assessment, treatment approach, monitoring requirements, key contraindications, and follow-up. Keep concise for demonstration. Cite guidelines in notes field.
+
+JSON only - no additional text:
+"""
+    
+    def __init__(self, api_key: str, model: str = "sonar", max_concurrent_requests: int = 4):
         self.api_key = api_key
         self.model = model
         self.base_url = "https://api.perplexity.ai/chat/completions"
-        self.logger = logging.getLogger(__name__)
+        self._semaphore = threading.BoundedSemaphore(max_concurrent_requests)
+        
+        self._session = HTTPSession.create(retry_on_status=True)
+        self._session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+        
+        self._payload = ChatPayload(
+            "You are a medical AI that provides evidence-based clinical pathways in JSON format. Always respond with valid JSON structure only. Never include explanations outside the JSON.",
+            model=model,
+            temperature=0.0,
+            max_tokens=4000
+        )
     
     def get_treatment_recommendations(self, diagnosis: Diagnosis, 
                                     patient_age: int, 
@@ -23,58 +68,41 @@ class PerplexityTreatmentRecommender(TreatmentRecommenderInterface):
             raise ValueError("Perplexity API key not configured")
         
         try:
-            self.logger.info(f"Getting treatment recommendations for {diagnosis.diagnosis_name} using Perplexity")
+            logger.info("Getting treatment recommendations for %s using Perplexity", diagnosis.diagnosis_name)
             
             #Create treatment query prompt
             prompt = self._create_treatment_prompt(diagnosis, patient_age, patient_gender)
             
-            response = requests.post(
-                self.base_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": self.model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": "You are a medical AI that provides evidence-based clinical pathways in JSON format. Always respond with valid JSON structure only. Never include explanations outside the JSON."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.0, 
-                    "max_tokens": 4000
-                },
-                timeout=45
-            )
+            with self._semaphore:
+                response = self._session.post(
+                    self.base_url,
+                    data=self._payload.render(prompt),
+                    timeout=45
+                )
             
-            self.logger.info(f"Perplexity API response status: {response.status_code}")
+            logger.debug("Perplexity API response status: %s", response.status_code)
             
             if response.status_code != 200:
-                self.logger.error(f"Perplexity API Error: {response.status_code}")
-                self.logger.error(f"Response content: {response.text}")
+                logger.error("Perplexity API Error: %s", response.status_code)
+                logger.error("Response content: %s", response.text)
                 response.raise_for_status()
             
-            result = response.json()
+            result = orjson.loads(response.content)
             content = result["choices"][0]["message"]["content"]
             
             #Log the raw content for debugging
-            self.logger.info(f"Perplexity pathway response: {content[:200]}...")
+            logger.debug("Perplexity pathway response: %.200s...", content)
             
             #Extract citations from response
             citations = result.get("citations", [])
-            self.logger.info(f"Extracted {len(citations)} citations from Perplexity response")
+            logger.debug("Extracted %d citations from Perplexity response", len(citations))
             
             #Extract JSON from response 
             json_content = self._extract_json_from_response(content)
             
             #Try to parse as JSON
             try:
-                pathway_data = json.loads(json_content)
+                pathway_data = orjson.loads(json_content)
                 recommendations = []
                 
                 for rec_data in pathway_data.get("clinical_pathway", []):
@@ -87,13 +115,13 @@ class PerplexityTreatmentRecommender(TreatmentRecommenderInterface):
                     )
                     recommendations.append(recommendation)
                 
-                self.logger.info(f"Parsed {len(recommendations)} recommendations from JSON response")
+                logger.debug("Parsed %d recommendations from JSON response", len(recommendations))
                 return recommendations, citations
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 # Fallback: create basic recommendations from text
-                self.logger.warning(f"JSON parsing failed: {str(e)}")
-                self.logger.info("Creating basic recommendations from text")
+                logger.warning("JSON parsing failed: %s", e)
+                logger.info("Creating basic recommendations from text")
                 basic_rec = TreatmentRecommendation(
                     category="clinical",
                     recommendation="Clinical pathway available - see evidence sources for detailed protocol",
@@ -115,15 +143,15 @@ class PerplexityTreatmentRecommender(TreatmentRecommenderInterface):
                 )
                 recommendations.append(recommendation)
             
-            self.logger.info(f"Generated {len(recommendations)} treatment recommendations")
+            logger.info("Generated %d treatment recommendations", len(recommendations))
             return recommendations, citations
             
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"Error in Perplexity treatment request: {str(e)}")
+            logger.error("Error in Perplexity treatment request: %s", e)
             raise ValueError(f"Error communicating with Perplexity API: {str(e)}")
         
         except Exception as e:
-            self.logger.error(f"Error getting treatment recommendations: {str(e)}")
+            logger.error("Error getting treatment recommendations: %s", e)
             raise ValueError(f"Error in treatment recommendation: {str(e)}")
     
     def _create_treatment_prompt(self, diagnosis: Diagnosis, patient_age: int, patient_gender: str) -> str:
@@ -134,27 +162,7 @@ class PerplexityTreatmentRecommender(TreatmentRecommenderInterface):
         return f"""
 Act as a clinical research assistant and develop a comprehensive care pathway for primary diagnosis: {diagnosis.diagnosis_name.upper()} (ICD-10: {diagnosis.icd_10_code.code}).
 
-Patient profile: {patient_age} years old{gender_text}
-
-Based on recent research and current clinical practice guidelines from US, Canada, and Europe (prioritize ≥2023-2025 sources: AHA/ACC, NICE, ESC, USPSTF, CDC, CADTH).
-
-Return ONLY this JSON structure:
-
-{{
-    "clinical_pathway": [
-        {{
-            "recommendation": "Specific clinical recommendation with dosage/details",
-            "priority": "high/medium/low",
-            "duration": "timeframe or null",
-            "notes": "evidence source and additional context"
-        }}
-    ]
-}}
-
-Include: initial assessment, treatment approach, monitoring requirements, key contraindications, and follow-up. Keep concise for demonstration. Cite guidelines in notes field.
-
-JSON only - no additional text:
-"""
+Patient profile: {patient_age} years old{gender_text}""" + self._TREATMENT_TAIL
     
     def _extract_json_from_response(self, content: str) -> str:
         """Extract JSON from response, handling markdown wrappers and extra text"""
@@ -162,20 +170,16 @@ JSON only - no additional text:
         #Remove any markdown code blocks
         content = content.strip()
         
-        # 1 - Look for JSON wrapped in markdown
-        if "```json" in content:
-            #Extract content between ```json and ```
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            if end != -1:
-                json_content = content[start:end].strip()
-                self.logger.info("Extracted JSON from markdown wrapper")
-                return json_content
+        # 1 - Look for JSON wrapped in markdown (single regex scan)
+        match = _JSON_FENCE_RE.search(content)
+        if match:
+            logger.debug("Extracted JSON from markdown wrapper")
+            return match.group(1).strip()
         
         # 2 - Look for JSON between ``` without json specifier
         if content.startswith("```") and content.endswith("```"):
             json_content = content[3:-3].strip()
-            self.logger.info("Extracted JSON from generic markdown wrapper")
+            logger.debug("Extracted JSON from generic markdown wrapper")
             return json_content
         
         # 3 - Look for JSON object in the text (find first { and last })
@@ -184,11 +188,11 @@ JSON only - no additional text:
         
         if start_brace != -1 and end_brace != -1 and end_brace > start_brace:
             json_content = content[start_brace:end_brace + 1]
-            self.logger.info("Extracted JSON from text using brace detection")
+            logger.debug("Extracted JSON from text using brace detection")
             return json_content
         
         # If no JSON structure found, return original content
-        self.logger.warning("No JSON structure detected, returning original content")
+        logger.warning("No JSON structure detected, returning original content")
         return content
     
     def is_ready(self) -> bool:
@@ -0,0 +1,24 @@
+import pytest
+
+from config.app_config import AppConfig
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    AppConfig.from_environment.cache_clear()
+    yield
+    AppConfig.from_environment.cache_clear()
+
+def test_default_llm_limit_is_below_function_concurrency(monkeypatch):
+    monkeypatch.delenv("MAX_CONCURRENT_LLM", raising=False)
+    monkeypatch.delenv("FUNCTION_CONCURRENCY", raising=False)
+    
+    config = AppConfig.from_environment()
+    
+    assert config.max_concurrent_llm < config.function_concurrency
+
+def test_llm_limit_not_below_function_concurrency_is_rejected(monkeypatch):
+    monkeypatch.setenv("FUNCTION_CONCURRENCY", "6")
+    monkeypatch.setenv("MAX_CONCURRENT_LLM", "6")
+    
+    with pytest.raises(ValueError, match="MAX_CONCURRENT_LLM"):
+        AppConfig.from_environment()
@@ -0,0 +1,22 @@
+import orjson
+
+from utils.chat_payload import ChatPayload
+
+def test_render_matches_plain_serialization():
+    payload = ChatPayload("Reply in JSON", model="gpt-4", temperature=0.1, max_tokens=1000)
+    prompt = 'Quote " backslash \\ newline \n and braces {}'
+    
+    assert orjson.loads(payload.render(prompt)) == {
+        "model": "gpt-4",
+        "temperature": 0.1,
+        "max_tokens": 1000,
+        "messages": [
+            {"role": "system", "content": "Reply in JSON"},
+            {"role": "user", "content": prompt}
+        ]
+    }
+
+def test_render_includes_response_format():
+    payload = ChatPayload("sys", model="gpt-4o", response_format={"type": "json_object"})
+    
+    assert orjson.loads(payload.render("hi"))["response_format"] == {"type": "json_object"}
@@ -0,0 +1,34 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from services.http_file_downloader import HTTPFileDownloader
+
+class _TruncatedHandler(BaseHTTPRequestHandler):
+    """Announces 1000 bytes, sends 10 and closes the connection"""
+    
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", "1000")
+        self.end_headers()
+        self.wfile.write(b"x" * 10)
+        self.wfile.flush()
+        self.close_connection = True
+    
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def truncated_url():
+    server = HTTPServer(("127.0.0.1", 0), _TruncatedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/audio.mp3"
+    server.shutdown()
+    server.server_close()
+
+def test_download_stream_truncated_body_raises_value_error(truncated_url):
+    with pytest.raises(ValueError, match="Download error"):
+        HTTPFileDownloader(timeout=5).download_stream(truncated_url)
@@ -0,0 +1,135 @@
+from interfaces.diagnosis_generator import DiagnosisGeneratorInterface, TreatmentRecommenderInterface
+from interfaces.medical_extractor import MedicalExtractorInterface
+from models.diagnosis_models import Diagnosis, ICDCode, TreatmentRecommendation
+from models.medical_models import MedicalExtractionResult, PatientInfo, Symptom
+from services.cached_diagnosis_generator import CachedDiagnosisGenerator
+from services.cached_medical_extractor import CachedMedicalExtractor
+from services.cached_treatment_recommender import CachedTreatmentRecommender
+from utils.lru_cache import LRUCache
+
+def _extraction(symptom: str = "headache") -> MedicalExtractionResult:
+    return MedicalExtractionResult(
+        patient_info=PatientInfo(age=45, gender="male"),
+        symptoms=[Symptom(symptom=symptom)],
+        reason_for_consultation=symptom
+    )
+
+def _diagnosis(name: str = "Migraine", code: str = "G43.1") -> Diagnosis:
+    return Diagnosis(
+        diagnosis_name=name,
+        icd_10_code=ICDCode(code=code, description="desc", category="cat"),
+        confidence_score=0.8,
+        reasoning="fits",
+        supporting_symptoms=["headache"]
+    )
+
+class CountingExtractor(MedicalExtractorInterface):
+    def __init__(self):
+        self.calls = 0
+    
+    def extract_medical_info(self, text: str) -> MedicalExtractionResult:
+        self.calls += 1
+        return _extraction(text.split()[0])
+    
+    def is_ready(self) -> bool:
+        return True
+
+class CountingGenerator(DiagnosisGeneratorInterface):
+    def __init__(self):
+        self.calls = 0
+    
+    def generate_diagnosis_with_icd10(self, medical_info, max_diagnoses=3):
+        self.calls += 1
+        return [_diagnosis()]
+    
+    def is_ready(self) -> bool:
+        return True
+
+class CountingRecommender(TreatmentRecommenderInterface):
+    def __init__(self):
+        self.calls = 0
+    
+    def get_treatment_recommendations(self, diagnosis, patient_age, patient_gender=None):
+        self.calls += 1
+        recommendation = TreatmentRecommendation(category="medication", recommendation="rest", priority="high")
+        return [recommendation], ["https://example.com"]
+    
+    def is_ready(self) -> bool:
+        return True
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.set("c", 3)
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+def test_extractor_cache_hits_on_identical_text():
+    inner = CountingExtractor()
+    cached = CachedMedicalExtractor(inner)
+    
+    first = cached.extract_medical_info("headache for three days")
+    second = cached.extract_medical_info("headache for three days")
+    
+    assert inner.calls == 1
+    assert second is first
+
+def test_extractor_cache_key_ignores_whitespace_only_differences():
+    inner = CountingExtractor()
+    cached = CachedMedicalExtractor(inner)
+    
+    first = cached.extract_medical_info("headache for three days")
+    second = cached.extract_medical_info("  headache\nfor   three days ")
+    
+    assert inner.calls == 1
+    assert second is first
+
+def test_extractor_cache_misses_on_different_text():
+    inner = CountingExtractor()
+    cached = CachedMedicalExtractor(inner)
+    
+    cached.extract_medical_info("headache for three days")
+    cached.extract_medical_info("fever for three days")
+    
+    assert inner.calls == 2
+
+def test_diagnosis_cache_key_includes_max_diagnoses():
+    inner = CountingGenerator()
+    cached = CachedDiagnosisGenerator(inner)
+    
+    cached.generate_diagnosis_with_icd10(_extraction(), 3)
+    cached.generate_diagnosis_with_icd10(_extraction(), 3)
+    assert inner.calls == 1
+    
+    cached.generate_diagnosis_with_icd10(_extraction(), 2)
+    assert inner.calls == 2
+
+def test_diagnosis_cache_hit_returns_a_copy():
+    cached = CachedDiagnosisGenerator(CountingGenerator())
+    
+    cached.generate_diagnosis_with_icd10(_extraction()).clear()
+    
+    assert len(cached.generate_diagnosis_with_icd10(_extraction())) == 1
+
+def test_treatment_cache_key_is_case_insensitive_on_diagnosis_name():
+    inner = CountingRecommender()
+    cached = CachedTreatmentRecommender(inner)
+    
+    cached.get_treatment_recommendations(_diagnosis("Migraine"), 45, "male")
+    recommendations, citations = cached.get_treatment_recommendations(_diagnosis("MIGRAINE"), 45, "male")
+    
+    assert inner.calls == 1
+    assert len(recommendations) == 1 and citations == ["https://example.com"]
+
+def test_treatment_cache_misses_on_different_patient():
+    inner = CountingRecommender()
+    cached = CachedTreatmentRecommender(inner)
+    
+    cached.get_treatment_recommendations(_diagnosis(), 45, "male")
+    cached.get_treatment_recommendations(_diagnosis(), 60, "male")
+    
+    assert inner.calls == 2
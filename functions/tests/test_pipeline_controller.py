@@ -0,0 +1,108 @@
+import io
+
+import orjson
+
+from controllers.audio_controller import AudioController
+from controllers.pipeline_controller import PipelineController
+from interfaces.audio_processor import AudioProcessorInterface
+from interfaces.file_downloader import FileDownloaderInterface
+from interfaces.medical_extractor import MedicalExtractorInterface
+from models.diagnosis_models import Diagnosis, DiagnosisGenerationResult, ICDCode
+from models.medical_models import MedicalExtractionResult, PatientInfo, Symptom
+from models.pipeline_models import AudioPipelineInput
+from services.json_response_formatter import JSONResponseFormatter
+
+TRANSCRIPT = "Patient reports a mild cough since yesterday."
+
+class FakeDownloader(FileDownloaderInterface):
+    def download_stream(self, url, max_size_mb=50):
+        return io.BytesIO(b"audio")
+
+class FakeAudioProcessor(AudioProcessorInterface):
+    def __init__(self, ready=True):
+        self.ready = ready
+    
+    def process_audio(self, file_path, language=None, max_duration=None):
+        return {
+            "transcription": TRANSCRIPT,
+            "duration_seconds": 3.0,
+            "language_detected": "english",
+            "model_used": "whisper-1"
+        }
+    
+    def is_ready(self):
+        return self.ready
+
+class FakeExtractor(MedicalExtractorInterface):
+    def __init__(self, symptoms):
+        self.symptoms = symptoms
+    
+    def extract_medical_info(self, text):
+        return MedicalExtractionResult(
+            patient_info=PatientInfo(),
+            symptoms=[Symptom(symptom=s) for s in self.symptoms],
+            reason_for_consultation="check-up"
+        )
+    
+    def is_ready(self):
+        return True
+
+class RecordingDiagnosisController:
+    def __init__(self):
+        self.calls = []
+    
+    def build_diagnosis(self, input_data):
+        self.calls.append(input_data)
+        primary = Diagnosis(
+            diagnosis_name="Acute bronchitis",
+            icd_10_code=ICDCode(code="J20.9", description="Acute bronchitis, unspecified", category="Respiratory"),
+            confidence_score=0.7,
+            reasoning="cough",
+            supporting_symptoms=["cough"]
+        )
+        result = DiagnosisGenerationResult(primary_diagnosis=primary, treatment_plan=[])
+        return result, {"diagnoses_generated": 1}
+
+def _pipeline(symptoms, ready=True):
+    formatter = JSONResponseFormatter()
+    audio_controller = AudioController(FakeAudioProcessor(ready), FakeDownloader(), formatter)
+    diagnosis_controller = RecordingDiagnosisController()
+    pipeline = PipelineController(audio_controller, FakeExtractor(symptoms), diagnosis_controller, formatter)
+    return pipeline, diagnosis_controller
+
+def _input():
+    return AudioPipelineInput(audio_url="https://example.com/audio.mp3")
+
+def test_skips_diagnosis_when_no_symptoms_found():
+    pipeline, diagnosis_controller = _pipeline(symptoms=[])
+    
+    response = pipeline.process_audio_pipeline(_input())
+    body = orjson.loads(response.get_data())
+    
+    assert response.status_code == 200
+    assert diagnosis_controller.calls == []
+    assert body["result"]["diagnosis"] is None
+    assert body["result"]["transcription"]["transcription"] == TRANSCRIPT
+    assert body["metadata"]["skipped"] == "diagnosis"
+    assert body["metadata"]["symptoms_found"] == 0
+
+def test_runs_diagnosis_when_symptoms_found():
+    pipeline, diagnosis_controller = _pipeline(symptoms=["cough"])
+    
+    response = pipeline.process_audio_pipeline(_input())
+    body = orjson.loads(response.get_data())
+    
+    assert response.status_code == 200
+    assert len(diagnosis_controller.calls) == 1
+    assert diagnosis_controller.calls[0].medical_info.symptoms[0].symptom == "cough"
+    assert body["result"]["diagnosis"]["primary_diagnosis"]["icd_10_code"]["code"] == "J20.9"
+    assert body["metadata"]["diagnoses_generated"] == 1
+    assert "skipped" not in body["metadata"]
+
+def test_returns_503_when_audio_processor_not_ready():
+    pipeline, diagnosis_controller = _pipeline(symptoms=["cough"], ready=False)
+    
+    response = pipeline.process_audio_pipeline(_input())
+    
+    assert response.status_code == 503
+    assert orjson.loads(response.get_data())["error"]["code"] == "service_unavailable"
@@ -0,0 +1,55 @@
+import flask
+import orjson
+import pytest
+
+from middleware.validation_middleware import ValidationMiddleware
+from models.audio_models import AudioLinkInput
+from services.json_response_formatter import JSONResponseFormatter
+
+@pytest.fixture
+def client():
+    app = flask.Flask(__name__)
+    formatter = JSONResponseFormatter()
+    validation = ValidationMiddleware(formatter)
+    
+    @app.route('/audio-link', methods=['POST'])
+    @validation.validate_json(AudioLinkInput)
+    def audio_link():
+        return formatter.success_response(flask.g.validated_data.model_dump(mode="json"))
+    
+    return app.test_client()
+
+def _error_code(response):
+    return orjson.loads(response.get_data())["error"]["code"]
+
+def test_valid_body_reaches_the_endpoint(client):
+    response = client.post('/audio-link', json={"audio_url": "https://example.com/a.mp3", "max_duration": 60})
+    
+    assert response.status_code == 200
+    result = orjson.loads(response.get_data())["result"]
+    assert result["max_duration"] == 60
+    assert result["language"] is None
+
+def test_wrong_content_type_is_415(client):
+    response = client.post('/audio-link', data="audio_url=x", content_type="text/plain")
+    
+    assert response.status_code == 415
+    assert _error_code(response) == "invalid_content_type"
+
+def test_empty_body_is_400(client):
+    response = client.post('/audio-link', data=b"  ", content_type="application/json")
+    
+    assert response.status_code == 400
+    assert _error_code(response) == "empty_body"
+
+def test_malformed_json_is_400(client):
+    response = client.post('/audio-link', data=b"{not json", content_type="application/json")
+    
+    assert response.status_code == 400
+    assert _error_code(response) == "json_error"
+
+def test_schema_violation_is_422(client):
+    response = client.post('/audio-link', json={"audio_url": "https://example.com/a.mp3", "max_duration": 0})
+    
+    assert response.status_code == 422
+    assert _error_code(response) == "validation_error"
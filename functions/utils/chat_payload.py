@@ -0,0 +1,22 @@
+import orjson
+from typing import Any
+
+# Serialized tail of the empty user message the template is built with
+_EMPTY_USER_TAIL = b'""}]}'
+
+class ChatPayload:
+    """Chat completion body serialized once; only the user message varies"""
+    
+    def __init__(self, system_prompt: str, **params: Any):
+        body = orjson.dumps({
+            **params,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": ""}
+            ]
+        })
+        self._prefix = body[:-len(_EMPTY_USER_TAIL)]
+    
+    def render(self, user_content: str) -> bytes:
+        """JSON request body with user_content as the user message"""
+        return self._prefix + orjson.dumps(user_content) + b'}]}'
@@ -0,0 +1,41 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+class HTTPSession:
+    """Pooled HTTP sessions"""
+    
+    # Rate limits and gateway errors that usually clear on their own
+    TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+    
+    @staticmethod
+    def create(pool_size: int = 20, retries: int = 3, retry_on_status: bool = False) -> requests.Session:
+        """Session that keeps connections alive and retries failed connects
+        
+        With retry_on_status, transient API responses are retried too, for
+        any method, with exponential backoff and Retry-After honoured. Only
+        enable it for replayable bodies (bytes, not streamed uploads).
+        """
+        
+        if retry_on_status:
+            retry = Retry(
+                total=retries,
+                read=0,
+                backoff_factor=1.0,
+                status_forcelist=HTTPSession.TRANSIENT_STATUSES,
+                allowed_methods=None,
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        else:
+            retry = Retry(total=retries, backoff_factor=0.3)
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
@@ -1,7 +1,24 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
+# No format below prints thread or process info, so skip collecting it
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+_LEAN_FORMAT = '%(asctime)s %(levelname)s %(name)s %(message)s'
+_DEBUG_FORMAT = (
+    '%(asctime)s - %(name)s - %(levelname)s - '
+    '%(funcName)s:%(lineno)d - %(message)s'
+)
+
+# Record fields that need a stack walk to find the caller
+_CALLER_FIELDS = ('%(funcName)', '%(lineno)', '%(pathname)', '%(filename)', '%(module)')
+
 class Logger:
     """Logging"""
     
@@ -10,20 +27,32 @@ class Logger:
                      format_string: Optional[str] = None) -> None:
         """Loggin Configuritation"""
         
+        root = logging.getLogger()
+        if root.handlers:
+            # Already configured, same as logging.basicConfig
+            return
+        
+        debug = level.upper() == "DEBUG"
         if format_string is None:
-            format_string = (
-                '%(asctime)s - %(name)s - %(levelname)s - '
-                '%(funcName)s:%(lineno)d - %(message)s'
-            )
+            format_string = _DEBUG_FORMAT if debug else _LEAN_FORMAT
+        
+        if not debug and not any(field in format_string for field in _CALLER_FIELDS):
+            # Nothing prints the caller, so skip the per-record frame lookup
+            logging._srcfile = None
+        
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter(format_string))
+        
+        # Request threads only enqueue records; the listener thread does
+        # the stdout writes
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        listener.start()
+        atexit.register(listener.stop)
         
-        logging.basicConfig(
-            level=getattr(logging, level.upper()),
-            format=format_string,
-            handlers=[
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        root.setLevel(getattr(logging, level.upper()))
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
         
         logging.getLogger('transformers').setLevel(logging.WARNING)
         logging.getLogger('torch').setLevel(logging.WARNING)
-        logging.getLogger('librosa').setLevel(logging.WARNING)
\ No newline at end of file
+        logging.getLogger('librosa').setLevel(logging.WARNING)